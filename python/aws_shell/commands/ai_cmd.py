@@ -6,7 +6,6 @@ import subprocess
 import threading
 
 from rich.console import Console
-from rich.markdown import Markdown
 
 console = Console()
 
@@ -220,6 +219,9 @@ def _execute_with_approval(commands, registry, config, session_manager):
 
 def _render_response(text):
     """Render LLM output as Rich Markdown."""
+    # rich.markdown pulls in markdown-it; only load it once there's a reply
+    from rich.markdown import Markdown
+
     console.print()
     console.print(Markdown(text))
     console.print()
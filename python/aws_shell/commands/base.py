@@ -1,6 +1,8 @@
 """Subcommand dispatch helper."""
 from rich.console import Console
 
+from ..utils.cache import strip_no_cache
+
 console = Console()
 
 
@@ -13,7 +15,7 @@ def subcommand_dispatch(service_name, subcommands, args, config, session_manager
         )
         return
     sub = args[0].lower()
-    remaining = args[1:]
+    remaining = strip_no_cache(args[1:])
     if sub in subcommands:
         subcommands[sub](remaining, config, session_manager)
     else:
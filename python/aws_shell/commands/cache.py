@@ -6,6 +6,13 @@ from ..utils.output import print_json
 
 console = Console()
 
+STATUS_STYLES = {
+    "available": "[green]available[/green]",
+    "creating": "[yellow]creating[/yellow]",
+    "deleting": "[red]deleting[/red]",
+    "modifying": "[yellow]modifying[/yellow]",
+}
+
 
 def register(registry):
     registry.register("cache", handle_cache, "Cache commands (ElastiCache)")
@@ -29,12 +36,7 @@ def handle_cache(args, config, session_manager):
 
 def _status_display(status):
     """Colorize common cache statuses."""
-    return {
-        "available": "[green]available[/green]",
-        "creating": "[yellow]creating[/yellow]",
-        "deleting": "[red]deleting[/red]",
-        "modifying": "[yellow]modifying[/yellow]",
-    }.get(status, status)
+    return STATUS_STYLES.get(status, status)
 
 
 # ---------------------------------------------------------------------------
@@ -6,6 +6,11 @@ from ..utils.output import print_json
 
 console = Console()
 
+DISTRIBUTION_STATUS_STYLES = {
+    "Deployed": "[green]Deployed[/green]",
+    "InProgress": "[yellow]InProgress[/yellow]",
+}
+
 
 def register(registry):
     registry.register("cloudfront", handle_cloudfront, "CloudFront distribution commands")
@@ -35,10 +40,7 @@ def list_distributions(args, config, session_manager):
     for dist in dist_list.get("Items", []):
         aliases = dist.get("Aliases", {}).get("Items", [])
         status = dist.get("Status", "")
-        status_display = {
-            "Deployed": "[green]Deployed[/green]",
-            "InProgress": "[yellow]InProgress[/yellow]",
-        }.get(status, status)
+        status_display = DISTRIBUTION_STATUS_STYLES.get(status, status)
 
         table.add_row(
             dist["Id"],
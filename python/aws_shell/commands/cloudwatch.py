@@ -6,6 +6,12 @@ from ..utils.output import print_json
 
 console = Console()
 
+ALARM_STATE_STYLES = {
+    "OK": "[green]OK[/green]",
+    "ALARM": "[red]ALARM[/red]",
+    "INSUFFICIENT_DATA": "[yellow]INSUFFICIENT_DATA[/yellow]",
+}
+
 
 def register(registry):
     registry.register("cw", handle_cw, "CloudWatch monitoring commands")
@@ -37,11 +43,7 @@ def list_alarms(args, config, session_manager):
     for page in paginator.paginate():
         for alarm in page.get("MetricAlarms", []):
             state = alarm.get("StateValue", "")
-            state_display = {
-                "OK": "[green]OK[/green]",
-                "ALARM": "[red]ALARM[/red]",
-                "INSUFFICIENT_DATA": "[yellow]INSUFFICIENT_DATA[/yellow]",
-            }.get(state, state)
+            state_display = ALARM_STATE_STYLES.get(state, state)
 
             table.add_row(
                 alarm["AlarmName"],
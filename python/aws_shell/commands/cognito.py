@@ -6,6 +6,13 @@ from ..utils.output import print_json
 
 console = Console()
 
+USER_STATUS_STYLES = {
+    "CONFIRMED": "[green]CONFIRMED[/green]",
+    "UNCONFIRMED": "[yellow]UNCONFIRMED[/yellow]",
+    "FORCE_CHANGE_PASSWORD": "[yellow]FORCE_CHANGE_PASSWORD[/yellow]",
+    "DISABLED": "[red]DISABLED[/red]",
+}
+
 
 def register(registry):
     registry.register("cognito", handle_cognito, "Cognito user pool commands")
@@ -77,12 +84,7 @@ def list_users(args, config, session_manager):
 
     for user in response.get("Users", []):
         status = user.get("UserStatus", "")
-        status_display = {
-            "CONFIRMED": "[green]CONFIRMED[/green]",
-            "UNCONFIRMED": "[yellow]UNCONFIRMED[/yellow]",
-            "FORCE_CHANGE_PASSWORD": "[yellow]FORCE_CHANGE_PASSWORD[/yellow]",
-            "DISABLED": "[red]DISABLED[/red]",
-        }.get(status, status)
+        status_display = USER_STATUS_STYLES.get(status, status)
 
         email = ""
         for attr in user.get("Attributes", []):
@@ -2,10 +2,19 @@
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
-from ..utils.output import print_json
+from ..utils.output import print_json, tag_value
 
 console = Console()
 
+INSTANCE_STATE_STYLES = {
+    "running": "[green]running[/green]",
+    "stopped": "[red]stopped[/red]",
+    "pending": "[yellow]pending[/yellow]",
+    "terminated": "[dim]terminated[/dim]",
+    "shutting-down": "[yellow]shutting-down[/yellow]",
+    "stopping": "[yellow]stopping[/yellow]",
+}
+
 
 def register(registry):
     registry.register("ec2", handle_ec2, "EC2 instance management commands")
@@ -39,19 +48,9 @@ def list_instances(args, config, session_manager):
     for page in paginator.paginate():
         for reservation in page["Reservations"]:
             for instance in reservation["Instances"]:
-                name = ""
-                for tag in instance.get("Tags", []):
-                    if tag["Key"] == "Name":
-                        name = tag["Value"]
+                name = tag_value(instance.get("Tags", ()), "Name")
                 state = instance["State"]["Name"]
-                state_display = {
-                    "running": "[green]running[/green]",
-                    "stopped": "[red]stopped[/red]",
-                    "pending": "[yellow]pending[/yellow]",
-                    "terminated": "[dim]terminated[/dim]",
-                    "shutting-down": "[yellow]shutting-down[/yellow]",
-                    "stopping": "[yellow]stopping[/yellow]",
-                }.get(state, state)
+                state_display = INSTANCE_STATE_STYLES.get(state, state)
 
                 table.add_row(
                     instance["InstanceId"],
@@ -6,6 +6,24 @@ from ..utils.output import print_json
 
 console = Console()
 
+CLUSTER_STATUS_STYLES = {
+    "ACTIVE": "[green]ACTIVE[/green]",
+    "INACTIVE": "[red]INACTIVE[/red]",
+    "PROVISIONING": "[yellow]PROVISIONING[/yellow]",
+}
+
+SERVICE_STATUS_STYLES = {
+    "ACTIVE": "[green]ACTIVE[/green]",
+    "DRAINING": "[yellow]DRAINING[/yellow]",
+    "INACTIVE": "[red]INACTIVE[/red]",
+}
+
+TASK_STATUS_STYLES = {
+    "RUNNING": "[green]RUNNING[/green]",
+    "PENDING": "[yellow]PENDING[/yellow]",
+    "STOPPED": "[red]STOPPED[/red]",
+}
+
 
 def register(registry):
     registry.register("ecs", handle_ecs, "ECS container service commands")
@@ -43,11 +61,7 @@ def list_clusters(args, config, session_manager):
 
     for cluster in details.get("clusters", []):
         status = cluster.get("status", "")
-        status_display = {
-            "ACTIVE": "[green]ACTIVE[/green]",
-            "INACTIVE": "[red]INACTIVE[/red]",
-            "PROVISIONING": "[yellow]PROVISIONING[/yellow]",
-        }.get(status, status)
+        status_display = CLUSTER_STATUS_STYLES.get(status, status)
 
         table.add_row(
             cluster.get("clusterName", ""),
@@ -102,11 +116,7 @@ def list_services(args, config, session_manager):
 
     for svc in details.get("services", []):
         status = svc.get("status", "")
-        status_display = {
-            "ACTIVE": "[green]ACTIVE[/green]",
-            "DRAINING": "[yellow]DRAINING[/yellow]",
-            "INACTIVE": "[red]INACTIVE[/red]",
-        }.get(status, status)
+        status_display = SERVICE_STATUS_STYLES.get(status, status)
 
         task_def = svc.get("taskDefinition", "").split("/")[-1]
 
@@ -146,11 +156,7 @@ def list_tasks(args, config, session_manager):
     for task in details.get("tasks", []):
         task_id = task.get("taskArn", "").split("/")[-1]
         status = task.get("lastStatus", "")
-        status_display = {
-            "RUNNING": "[green]RUNNING[/green]",
-            "PENDING": "[yellow]PENDING[/yellow]",
-            "STOPPED": "[red]STOPPED[/red]",
-        }.get(status, status)
+        status_display = TASK_STATUS_STYLES.get(status, status)
 
         task_def = task.get("taskDefinitionArn", "").split("/")[-1]
 
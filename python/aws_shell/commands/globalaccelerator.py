@@ -6,6 +6,11 @@ from ..utils.output import print_json
 
 console = Console()
 
+ACCELERATOR_STATUS_STYLES = {
+    "DEPLOYED": "[green]DEPLOYED[/green]",
+    "IN_PROGRESS": "[yellow]IN_PROGRESS[/yellow]",
+}
+
 
 def register(registry):
     registry.register("ga", handle_ga, "Global Accelerator commands")
@@ -33,10 +38,7 @@ def list_accelerators(args, config, session_manager):
 
     for accel in response.get("Accelerators", []):
         status = accel.get("Status", "")
-        status_display = {
-            "DEPLOYED": "[green]DEPLOYED[/green]",
-            "IN_PROGRESS": "[yellow]IN_PROGRESS[/yellow]",
-        }.get(status, status)
+        status_display = ACCELERATOR_STATUS_STYLES.get(status, status)
 
         table.add_row(
             accel.get("Name", ""),
@@ -157,7 +157,7 @@ SERVICE_HELP = {
     "ssm": {
         "description": "Systems Manager",
         "commands": {
-            "ssm list-parameters": "List all SSM parameters",
+            "ssm list-parameters [prefix]": "List SSM parameters (optionally filter by name prefix)",
             "ssm get-parameter <name>": "Get parameter value",
             "ssm list-instances": "List SSM managed instances",
             "ssm get-config <name>": "Get full parameter config as JSON",
@@ -204,7 +204,7 @@ SERVICE_HELP = {
     "search": {
         "description": "Fuzzy search through resource configs",
         "commands": {
-            "search <service> <id> <keyword>": "Search a resource's config for a keyword",
+            "search <service> <id> <keyword> [--no-cache]": "Search a resource's config for a keyword",
         },
     },
     "python": {
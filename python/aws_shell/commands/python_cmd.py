@@ -1,8 +1,20 @@
 """Python REPL mode - run arbitrary Python with boto3 pre-loaded."""
+import ast
+import builtins
 import codeop
+import functools
+import inspect
+import itertools
 import os
+import re
+import sys
 import traceback
+import weakref
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import boto3
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import FileHistory
 from prompt_toolkit.key_binding import KeyBindings
@@ -17,6 +29,10 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+from ..utils.cache import API_CACHE_TTL, SLOW_CACHE_TTL, api_cache, cache_peek, cached_call
+from ..utils.output import loads_json, print_json
+from ..utils.pagination import get_paginator
+from ..utils.search import fuzzy_search
 from ..utils.table import ResourceTable
 
 console = Console()
@@ -30,8 +46,9 @@ PYTHON_STYLE = Style.from_dict({
 })
 
 
-# Pre-loaded namespace variable names for syntax highlighting
-_NAMESPACE_NAMES = {
+# Pre-loaded namespace variable names for syntax highlighting (interned so
+# the per-token membership test can hit on pointer identity)
+_NAMESPACE_NAMES = frozenset(sys.intern(n) for n in {
     "session", "boto3", "config",
     # Service clients (with helpers)
     "ec2", "vpc", "asg", "s3", "iam", "lam", "aws_lambda", "cfn", "sts", "rds", "sqs", "ses",
@@ -40,8 +57,8 @@ _NAMESPACE_NAMES = {
     "cache", "cognito", "kms",
     # Utility functions
     "find", "docs", "help", "raw", "clear", "client", "resource", "set_region", "set_profile",
-    "login", "ai",
-}
+    "login", "ai", "list_all", "refresh",
+})
 
 
 def _auto_table(response):
@@ -54,36 +71,45 @@ def _auto_table(response):
     if not isinstance(response, dict):
         return response
 
-    # Strip metadata
-    cleaned = {k: v for k, v in response.items() if k != "ResponseMetadata"}
-
-    # Find the best list of dicts in the response
+    # One pass over the response (skipping ResponseMetadata) finds the best
+    # list of dicts, the first list of scalars and the only key if just one
     best_key = None
     best_list = None
-    for key, value in cleaned.items():
-        if isinstance(value, list) and value and isinstance(value[0], dict):
-            if best_list is None or len(value) > len(best_list):
-                best_key = key
-                best_list = value
+    best_len = 0
+    scalar_key = None
+    scalar_list = None
+    n_keys = 0
+    for key, value in response.items():
+        if key == "ResponseMetadata":
+            continue
+        n_keys += 1
+        if isinstance(value, list):
+            if not value:
+                continue
+            if isinstance(value[0], dict):
+                if len(value) > best_len:
+                    best_key, best_list, best_len = key, value, len(value)
+            elif scalar_list is None:
+                scalar_key, scalar_list = key, value
         # Handle nested: e.g. DistributionList -> Items
         elif isinstance(value, dict):
             for subkey, subval in value.items():
-                if isinstance(subval, list) and subval and isinstance(subval[0], dict):
-                    if best_list is None or len(subval) > len(best_list):
-                        best_key = f"{key}.{subkey}"
-                        best_list = subval
+                if (isinstance(subval, list) and subval and isinstance(subval[0], dict)
+                        and len(subval) > best_len):
+                    best_key, best_list, best_len = f"{key}.{subkey}", subval, len(subval)
 
     if best_list is not None:
         return ResourceTable(best_list, title=best_key)
 
     # If there's a simple list of strings/numbers (like QueueUrls, clusterArns)
-    for key, value in cleaned.items():
-        if isinstance(value, list) and value and not isinstance(value[0], dict):
-            return ResourceTable(value, title=key)
+    if scalar_list is not None:
+        return ResourceTable(scalar_list, title=scalar_key)
+
+    cleaned = {k: v for k, v in response.items() if k != "ResponseMetadata"}
 
     # Single-item responses: return the cleaned dict directly
-    if len(cleaned) == 1:
-        return list(cleaned.values())[0]
+    if n_keys == 1:
+        return next(iter(cleaned.values()))
 
     return cleaned
 
@@ -96,13 +122,56 @@ class ServiceHelper:
 
     Helper methods provide simpler interfaces:
         ec2.list_instances()  # returns ResourceTable
+
+    The client itself comes from client_factory and is only built on first
+    use, so creating a helper (or listing its helpers) costs no AWS setup.
     """
 
-    def __init__(self, name, client):
-        object.__setattr__(self, '_name', name)
-        object.__setattr__(self, '_client', client)
+    __slots__ = (
+        '_name', '_client_factory', '_helpers', '_helper_names',
+        '_dir_cache', '_dir_index', '_callables',
+    )
+    _SLOT_NAMES = frozenset(__slots__)
+
+    def __init__(self, name, client_factory):
+        self._name = name
+        self._client_factory = client_factory
+        self._helpers = {}
+        self._helper_names = None
+        self._dir_cache = None
+        self._dir_index = None
+        self._callables = None
+
+    def __setattr__(self, name, value):
+        # ec2.list_instances = fn attaches a helper; private names are slots
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            self.add_helper(name, value)
+
+    def add_helper(self, name, fn):
+        """Attach a convenience helper, e.g. ec2.add_helper("list_instances", fn)."""
+        self._helpers[name] = fn
+        # Attaching a helper changes dir(); drop the cached listings
+        self._helper_names = None
+        self._dir_cache = None
+        self._dir_index = None
+        self._callables = None
+
+    @property
+    def _client(self):
+        # Building a boto3 client loads its service model from disk, so it
+        # is deferred until the helper is first used (the factory caches it)
+        return self._client_factory()
 
     def __getattr__(self, name):
+        if name in ServiceHelper._SLOT_NAMES:
+            # Slot not set yet — don't recurse through self._helpers
+            raise AttributeError(name)
+        helper = self._helpers.get(name)
+        if helper is not None:
+            return helper
+
         attr = getattr(self._client, name)
         if not callable(attr):
             return attr
@@ -113,21 +182,51 @@ class ServiceHelper:
 
         wrapper.__name__ = name
         wrapper.__doc__ = getattr(attr, '__doc__', None)
+        # Lets docs() find the client method (and its parameters) directly
+        wrapper.__wrapped__ = attr
         return wrapper
 
+    def helper_names(self):
+        """Return the sorted names of the callable helpers attached so far."""
+        if self._helper_names is None:
+            names = [k for k, v in self._helpers.items() if callable(v)]
+            names.sort()
+            self._helper_names = names
+        return self._helper_names
+
     def __repr__(self):
-        helpers = sorted(
-            k for k in self.__dict__
-            if not k.startswith('_') and callable(self.__dict__[k])
-        )
+        helpers = self.helper_names()
         if helpers:
             return f"<{self._name} client — helpers: {', '.join(helpers)}>"
         return f"<{self._name} client>"
 
     def __dir__(self):
-        own = [k for k in self.__dict__ if not k.startswith('_')]
-        client_attrs = [a for a in dir(self._client) if not a.startswith('_')]
-        return sorted(set(own + client_attrs))
+        # dir() on a boto3 client walks hundreds of generated methods and
+        # tab completion asks on every keystroke, so compute it once — and
+        # reuse the client's own cached listing rather than walking it again
+        if self._dir_cache is None:
+            names = set(self._helpers)
+            names.update(name for _, name in _client_attr_cache(self._client)[0])
+            self._dir_cache = sorted(names)
+        return self._dir_cache
+
+    def _completion_index(self):
+        """Return dir() as (lowercased, name) pairs sorted for bisect lookups."""
+        if self._dir_index is None:
+            self._dir_index = _sorted_index(self.__dir__())
+        return self._dir_index
+
+
+# `tokentype in Name` walks Pygments' token hierarchy in Python; the lexer
+# only ever emits a handful of token types, so remember the answer per type
+_NAME_TOKEN_TYPES = {}
+
+
+def _is_name_token(tokentype):
+    is_name = _NAME_TOKEN_TYPES.get(tokentype)
+    if is_name is None:
+        is_name = _NAME_TOKEN_TYPES[tokentype] = tokentype in Name
+    return is_name
 
 
 class AWSPythonLexer(Python3Lexer):
@@ -137,7 +236,10 @@ class AWSPythonLexer(Python3Lexer):
 
     def get_tokens_unprocessed(self, text):
         for index, tokentype, value in super().get_tokens_unprocessed(text):
-            if tokentype in Name and value in _NAMESPACE_NAMES:
+            if len(value) <= 32:
+                value = sys.intern(value)
+            # Hash lookup first: almost no tokens are namespace names
+            if value in _NAMESPACE_NAMES and _is_name_token(tokentype):
                 yield index, Name.Builtin, value
             else:
                 yield index, tokentype, value
@@ -157,6 +259,53 @@ _TABLE_METHODS = {
     "docs": ("attr", "Show docs for this method"),
 }
 
+# Python keywords and common builtins offered alongside namespace names,
+# paired with their lowercased form for case-insensitive matching
+_PY_KEYWORDS = (
+    "True", "False", "None", "print", "len", "type",
+    "list", "dict", "str", "int", "float", "bool",
+    "range", "enumerate", "zip", "map", "filter",
+    "sorted", "reversed", "isinstance", "hasattr",
+    "getattr", "setattr", "import", "from", "for",
+    "while", "if", "else", "elif", "try", "except",
+    "with", "as", "def", "class", "return", "yield",
+    "lambda", "and", "or", "not", "in", "is",
+)
+_PY_KEYWORDS_SET = frozenset(_PY_KEYWORDS)
+
+# The completion menu only shows a handful of rows; stop producing
+# candidates once this many have been yielded.
+_MAX_COMPLETIONS = 50
+
+
+def _sorted_index(names):
+    """Build a list of (lowercased, name) pairs sorted by the lowercased name."""
+    return sorted((name.lower(), name) for name in names)
+
+
+def _match_names(index, partial_lower):
+    """Split a sorted index into prefix matches and contains matches.
+
+    The prefix matches sit in one contiguous run of the sorted index, so
+    bisect finds them in O(log N + K). The substring scan over the rest is
+    skipped when the prefix run alone already fills the completion menu.
+    """
+    lo = bisect_left(index, (partial_lower,))
+    hi = lo
+    end = len(index)
+    while hi < end and index[hi][0].startswith(partial_lower):
+        hi += 1
+    prefix_matches = [name for _, name in index[lo:hi]]
+    contains_matches = []
+    if partial_lower and hi - lo < _MAX_COMPLETIONS:
+        # Names outside the run can't match at position 0, so one
+        # substring test per name is all the scan needs
+        contains_matches = [
+            name for name_lower, name in itertools.chain(index[:lo], index[hi:])
+            if partial_lower in name_lower
+        ]
+    return prefix_matches, contains_matches
+
 
 def _get_boto3_params(client, method_name):
     """Get parameter names and required flags for a boto3 method from botocore.
@@ -183,11 +332,140 @@ def _get_boto3_params(client, method_name):
         return None
 
 
+def _callable_names(obj):
+    """Return the names of callable public attributes on a boto3 client.
+
+    boto3 clients (and ServiceHelpers wrapping them) are classified from the
+    service model and the client class, so completion never has to
+    ``getattr`` every attribute on the instance. Returns None for any other
+    object — callers fall back to ``callable(getattr(obj, name))``.
+    """
+    if isinstance(obj, ServiceHelper):
+        # Same service, same answer — cached on the helper with its dir()
+        if obj._callables is None:
+            names = set(_callable_names(obj._client) or ())
+            names.update(k for k, v in obj._helpers.items() if callable(v))
+            obj._callables = frozenset(names)
+        return obj._callables
+    if not _is_boto3_client(obj):
+        return None
+    return _client_attr_cache(obj)[1]
+
+
+def _is_callable_attr(obj, name):
+    """Tell whether obj.name is callable without running properties.
+
+    The attribute is looked up statically, so completing on an arbitrary
+    object never executes its property getters or __getattr__.
+    """
+    try:
+        attr = inspect.getattr_static(obj, name)
+    except AttributeError:
+        return False
+    if isinstance(attr, (staticmethod, classmethod)):
+        return True
+    if isinstance(attr, property):
+        return False
+    return callable(attr)
+
+
+def _is_boto3_client(obj):
+    meta = getattr(obj, "meta", None)
+    return meta is not None and hasattr(meta, "service_model")
+
+
+# id(client) -> (weakref, sorted completion index, callable names) for raw
+# boto3 clients, e.g. client("ec2"). Entries go away with the client.
+_DIR_CACHE = {}
+
+
+def _client_attr_cache(client):
+    """Return (completion index, callable names) for a boto3 client, cached.
+
+    A client's attributes are fixed by its service model, so dir() and the
+    callable check only need to run once per client.
+    """
+    key = id(client)
+    entry = _DIR_CACHE.get(key)
+    if entry is not None and entry[0]() is client:
+        return entry[1], entry[2]
+
+    index = _sorted_index(a for a in dir(client) if not a.startswith("_"))
+    cls = type(client)
+    names = set(client.meta.method_to_api_mapping)
+    names.update(a for a in dir(cls) if callable(getattr(cls, a, None)))
+    callables = frozenset(names)
+    ref = weakref.ref(client, lambda _, key=key: _DIR_CACHE.pop(key, None))
+    _DIR_CACHE[key] = (ref, index, callables)
+    return index, callables
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_completion_expr(obj_text):
+    return compile(obj_text, "<completion>", "eval")
+
+
 class PythonCompleter(Completer):
     """Auto-completer that handles pre-loaded variables and Python attribute access."""
 
     def __init__(self, namespace):
         self.namespace = namespace
+        self._ns_index = None
+        # Candidate names (namespace keys plus keywords) behind _ns_index
+        self._ns_names = None
+        # (len(namespace), version) the index was built for
+        self._ns_stamp = None
+        self._ns_version = 0
+        # (obj_text, root object, resolved object) of the last lookup
+        self._resolved = None
+
+    def namespace_changed(self):
+        """Mark the namespace as modified, e.g. after running user code."""
+        self._ns_version += 1
+        # The code may have rebound attributes along a cached path (x.a = ...)
+        self._resolved = None
+
+    def _namespace_index(self):
+        # Rebuild only after user code ran or the size changed — typing
+        # alone never changes the candidate list
+        stamp = (len(self.namespace), self._ns_version)
+        if stamp != self._ns_stamp:
+            # Keywords shadowed by namespace keys (print, list, ...) collapse
+            # in the union, so each candidate is indexed exactly once
+            names = {n for n in self.namespace if not n.startswith("__")}
+            names |= _PY_KEYWORDS_SET
+            # Most executed lines don't bind new names; skip the re-sort then
+            if names != self._ns_names:
+                self._ns_names = names
+                self._ns_index = _sorted_index(names)
+            self._ns_stamp = stamp
+        return self._ns_index
+
+    def _resolve(self, obj_text):
+        """Resolve the object left of the dot being completed.
+
+        Plain dotted names (s3, ec2.meta, str) are walked with getattr
+        instead of eval, and the result is reused while the user keeps
+        typing after the same dot. Anything else still goes through eval.
+        """
+        parts = obj_text.split(".")
+        if not all(p.isidentifier() for p in parts):
+            # Literals such as 1.real — compiled once per text
+            return eval(_compile_completion_expr(obj_text), self.namespace)
+
+        if parts[0] in self.namespace:
+            root = self.namespace[parts[0]]
+        else:
+            root = getattr(builtins, parts[0])
+        cached = self._resolved
+        if cached is not None and cached[0] == obj_text and cached[1] is root:
+            return cached[2]
+
+        obj = root
+        for part in parts[1:]:
+            obj = getattr(obj, part)
+        self._resolved = (obj_text, root, obj)
+        return obj
 
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor
@@ -199,7 +477,7 @@ class PythonCompleter(Completer):
             return
 
         # Extract the current word being typed (the dotted expression at cursor)
-        word = self._get_expression_at_cursor(text)
+        word, after_call = self._get_expression_at_cursor(text)
 
         if "." in word:
             # Attribute completion: "s3.list" -> eval("s3"), complete "list"
@@ -207,36 +485,36 @@ class PythonCompleter(Completer):
             obj_text = word[:dot_idx]
             partial = word[dot_idx + 1:]
 
-            # Detect chained method calls: something().partial
-            # _get_expression_at_cursor stops at ), so check if the char
-            # just before our extracted word is ) or obj_text ends with )
-            preceding_idx = len(text) - len(word) - 1
-            is_chained = (
-                obj_text.endswith(")")
-                or (preceding_idx >= 0 and text[preceding_idx] == ")")
-            )
-            if is_chained:
+            # Chained method calls: something().partial
+            if after_call:
                 yield from self._complete_table_methods(partial)
                 return
 
             try:
-                obj = eval(obj_text, self.namespace)
-                attrs = [a for a in dir(obj) if not a.startswith("_")]
-                partial_lower = partial.lower()
+                obj = self._resolve(obj_text)
+                if isinstance(obj, ServiceHelper):
+                    index = obj._completion_index()
+                elif _is_boto3_client(obj):
+                    index = _client_attr_cache(obj)[0]
+                else:
+                    index = _sorted_index(a for a in dir(obj) if not a.startswith("_"))
 
                 # Split into prefix matches (shown first) and contains matches
-                prefix_matches = []
-                contains_matches = []
-                for attr in attrs:
-                    attr_lower = attr.lower()
-                    if attr_lower.startswith(partial_lower):
-                        prefix_matches.append(attr)
-                    elif partial_lower in attr_lower:
-                        contains_matches.append(attr)
+                prefix_matches, contains_matches = _match_names(index, partial.lower())
+
+                # Shorter names first — they're usually the common ones
+                prefix_matches.sort(key=len)
+                contains_matches.sort(key=len)
 
+                callables = _callable_names(obj)
+
+                n = 0
                 for attr in prefix_matches + contains_matches:
-                    member = getattr(obj, attr, None)
-                    if callable(member):
+                    if callables is not None:
+                        is_callable = attr in callables
+                    else:
+                        is_callable = _is_callable_attr(obj, attr)
+                    if is_callable:
                         yield Completion(
                             attr + "()",
                             start_position=-len(partial),
@@ -249,34 +527,21 @@ class PythonCompleter(Completer):
                             start_position=-len(partial),
                             display_meta="attr",
                         )
+                    n += 1
+                    if n >= _MAX_COMPLETIONS:
+                        break
             except Exception:
                 return
         else:
             # Complete from namespace keys + Python builtins
             partial = word
-            partial_lower = partial.lower()
-            candidates = list(self.namespace.keys())
-            candidates += ["True", "False", "None", "print", "len", "type",
-                           "list", "dict", "str", "int", "float", "bool",
-                           "range", "enumerate", "zip", "map", "filter",
-                           "sorted", "reversed", "isinstance", "hasattr",
-                           "getattr", "setattr", "import", "from", "for",
-                           "while", "if", "else", "elif", "try", "except",
-                           "with", "as", "def", "class", "return", "yield",
-                           "lambda", "and", "or", "not", "in", "is"]
 
             # Split into prefix matches (shown first) and contains matches
-            prefix_matches = []
-            contains_matches = []
-            for name in candidates:
-                if name.startswith("__"):
-                    continue
-                name_lower = name.lower()
-                if name_lower.startswith(partial_lower):
-                    prefix_matches.append(name)
-                elif partial_lower in name_lower:
-                    contains_matches.append(name)
+            prefix_matches, contains_matches = _match_names(
+                self._namespace_index(), partial.lower()
+            )
 
+            n = 0
             for name in prefix_matches + contains_matches:
                 ns_val = self.namespace.get(name)
                 if ns_val is not None and callable(ns_val):
@@ -288,6 +553,9 @@ class PythonCompleter(Completer):
                     )
                 else:
                     yield Completion(name, start_position=-len(partial))
+                n += 1
+                if n >= _MAX_COMPLETIONS:
+                    break
 
     def _try_complete_kwargs(self, text):
         """If cursor is inside a method call on a ServiceHelper, suggest kwargs.
@@ -295,8 +563,6 @@ class PythonCompleter(Completer):
         Detects patterns like: ec2.describe_instances(  or  ec2.describe_instances(Inst
         Returns an iterable of Completions, or None if not applicable.
         """
-        import re
-
         # Find the last unmatched ( — we might be inside a function call
         depth = 0
         paren_pos = -1
@@ -359,8 +625,9 @@ class PythonCompleter(Completer):
     @staticmethod
     def _complete_table_methods(partial):
         """Yield ResourceTable method completions for chained calls."""
+        partial_lower = partial.lower()
         for name, (kind, desc) in _TABLE_METHODS.items():
-            if name.lower().startswith(partial.lower()):
+            if name.lower().startswith(partial_lower):
                 if kind == "method":
                     yield Completion(
                         name + "()",
@@ -377,11 +644,187 @@ class PythonCompleter(Completer):
 
     @staticmethod
     def _get_expression_at_cursor(text):
-        """Extract the dotted expression at the cursor position."""
+        """Extract the dotted expression at the cursor position.
+
+        Returns (expression, after_call) where after_call is True when the
+        expression directly follows a ``)``, e.g. ``ec2.list_instances().fi``.
+        """
+        # Walk back from the cursor so the cost depends only on the length
+        # of the expression, not of the line or buffer it ends
         i = len(text) - 1
-        while i >= 0 and (text[i].isalnum() or text[i] in ("_", ".")):
+        while i >= 0 and (text[i].isalnum() or text[i] in "_."):
             i -= 1
-        return text[i + 1:]
+        return text[i + 1:], i >= 0 and text[i] == ")"
+
+
+# Startup banner for the REPL — static, so built once at import
+_HELP_PANEL = Panel(
+    "[bold]Python REPL Mode[/bold]\n\n"
+    "[bold]Clients[/bold] (type name to see helpers):\n"
+    "  [cyan]ec2[/cyan], [cyan]vpc[/cyan], [cyan]asg[/cyan], [cyan]s3[/cyan], "
+    "[cyan]iam[/cyan], [cyan]lam[/cyan] / [cyan]aws_lambda[/cyan], [cyan]cfn[/cyan], [cyan]sts[/cyan], "
+    "[cyan]rds[/cyan], [cyan]sqs[/cyan], [cyan]ses[/cyan], [cyan]opensearch[/cyan],\n"
+    "  [cyan]route53[/cyan], [cyan]ga_client[/cyan], [cyan]cloudfront[/cyan], "
+    "[cyan]cw[/cyan], [cyan]logs[/cyan], [cyan]secrets[/cyan], [cyan]dynamodb[/cyan],\n"
+    "  [cyan]ssm_client[/cyan], [cyan]ecs_client[/cyan], [cyan]sso_admin[/cyan], "
+    "[cyan]cache[/cyan], [cyan]cognito[/cyan], [cyan]kms[/cyan]\n\n"
+    "[bold]Examples:[/bold]\n"
+    "  [cyan]ec2.list_instances()[/cyan]                    "
+    "[dim]# Rich table output[/dim]\n"
+    "  [cyan]ec2.list_instances().filter(State=\"running\")[/cyan]  "
+    "[dim]# Filter rows[/dim]\n"
+    "  [cyan]ec2.list_instances().find(\"web\")[/cyan]           "
+    "[dim]# Fuzzy search[/dim]\n"
+    "  [cyan]ec2.list_instances().sort(\"Tags.Name\")[/cyan]     "
+    "[dim]# Sort by column[/dim]\n"
+    "  [cyan]ec2.list_instances().data[/cyan]                  "
+    "[dim]# Raw list of dicts[/dim]\n"
+    "  [cyan]ec2.list_instances().json()[/cyan]                "
+    "[dim]# JSON output[/dim]\n"
+    "  [cyan]ec2.describe_instances(InstanceIds=[...])[/cyan]  "
+    "[dim]# Direct boto3 call[/dim]\n\n"
+    "[bold]Utilities:[/bold]\n"
+    "  [cyan]docs()[/cyan]            - Overview of all clients & helpers\n"
+    "  [cyan]docs(ec2)[/cyan]         - Show helpers for a client\n"
+    "  [cyan]docs(find)[/cyan]        - Show docs for any function\n"
+    "  [cyan]find(data, kw)[/cyan]    - Fuzzy search through any data\n"
+    "  [cyan]list_all()[/cyan]        - Run every list helper in parallel\n"
+    "  [cyan]refresh()[/cyan]         - Drop cached list results (kept 30s)\n"
+    "  [cyan]client(name)[/cyan]      - Get any boto3 client\n"
+    "  [cyan]resource(name)[/cyan]    - Get any boto3 resource\n"
+    "  [cyan]set_region(name)[/cyan]  - Switch region (refreshes all clients)\n"
+    "  [cyan]set_profile(name)[/cyan] - Switch profile (refreshes all clients)\n\n"
+    "Type [bold]exit[/bold] or [bold]Ctrl+D[/bold] to return to AWS Shell.",
+    title="Python Mode",
+    border_style="green",
+)
+
+
+# Quick reference shown under the client table by docs()
+_DOCS_REFERENCE_PANEL = Panel(
+    "[bold]Utilities:[/bold]\n"
+    "  [cyan]find(data, kw)[/cyan]    Fuzzy search through any data\n"
+    "  [cyan]list_all()[/cyan]        Run every list helper in parallel\n"
+    "  [cyan]refresh()[/cyan]         Drop cached list results (kept 30s)\n"
+    "  [cyan]docs()[/cyan]            Show this overview\n"
+    "  [cyan]docs(ec2)[/cyan]         Show helpers + grouped boto3 methods\n"
+    "  [cyan]docs(ec2, 'list')[/cyan] Filter by category (list/describe/create/update/delete)\n"
+    "  [cyan]ec2 | help('list')[/cyan] Same via pipe syntax\n"
+    "  [cyan]docs(find)[/cyan]        Show docs for a function\n"
+    "  [cyan]client(name)[/cyan]      Get any boto3 client\n"
+    "  [cyan]resource(name)[/cyan]    Get any boto3 resource\n"
+    "  [cyan]set_region(name)[/cyan]  Switch region\n"
+    "  [cyan]set_profile(name)[/cyan] Switch profile\n\n"
+    "[bold]Table Methods[/bold] (call [cyan].help()[/cyan] on any table):\n"
+    "  [cyan].filter()[/cyan] [cyan].find()[/cyan] [cyan].sort()[/cyan] "
+    "[cyan].select()[/cyan] [cyan].data[/cyan] [cyan].json()[/cyan] [cyan].help()[/cyan]\n\n"
+    "[bold]Pipe Syntax:[/bold]\n"
+    "  [cyan]expr | find('kw')[/cyan]  [cyan]expr | docs[/cyan]  "
+    "[cyan]expr | keys[/cyan]  [cyan]expr | raw[/cyan]  [cyan]expr | len[/cyan]",
+    title="Quick Reference",
+    border_style="green",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _aws_python_lexer():
+    """Return the REPL lexer, shared by every session.
+
+    Setting it up compiles Pygments' whole Python regex table, so it is
+    built on first entry to Python mode rather than at shell startup.
+    """
+    return PygmentsLexer(AWSPythonLexer)
+
+
+# Decides on Enter whether the buffer holds a complete statement
+_COMMAND_COMPILER = codeop.CommandCompiler()
+
+
+def _is_simple_line(text):
+    """Cheap check for a one-liner that can be submitted without compiling.
+
+    Anything that might continue onto another line (open brackets, a block
+    header, a decorator, a line continuation or a triple-quoted string) is
+    left to the compiler, as is anything with a comment that could hide one.
+    """
+    if "\n" in text or "#" in text or '"""' in text or "'''" in text:
+        return False
+    stripped = text.rstrip()
+    if stripped.endswith((":", "\\")) or stripped.startswith("@"):
+        return False
+    return (text.count("(") == text.count(")")
+            and text.count("[") == text.count("]")
+            and text.count("{") == text.count("}"))
+
+
+@functools.lru_cache(maxsize=256)
+def _input_is_complete(text):
+    """Return False while the buffer still needs more lines.
+
+    Invalid code counts as complete so Enter submits it and the error is shown.
+    """
+    # Code that compiles is complete; this also leaves the code object in
+    # _compile_cached for _exec_python once the input is submitted
+    if _compile_cached(text)[2] is None:
+        return True
+    # Only codeop can tell "needs more lines" apart from a real error
+    try:
+        return _COMMAND_COMPILER(text, "<input>", "exec") is not None
+    except (SyntaxError, OverflowError, ValueError):
+        return True
+
+
+# Key bindings: Enter auto-submits if code is complete, otherwise adds a newline
+# Inside indented blocks, Enter always adds a newline; submit with a blank line.
+# Ctrl+R: reverse history search
+_KEY_BINDINGS = KeyBindings()
+
+
+@_KEY_BINDINGS.add(Keys.Enter)
+def _handle_enter(event):
+    buf = event.current_buffer
+    text = buf.text
+
+    if not text.strip():
+        buf.validate_and_handle()
+        return
+
+    # If cursor is NOT at the end, the user is editing mid-block — just insert newline
+    if buf.cursor_position < len(text):
+        buf.insert_text("\n")
+        return
+
+    # If the last line is indented, we're inside a block — always add newline
+    last_line = text[text.rfind("\n") + 1:]
+    if last_line.startswith((" ", "\t")):
+        buf.insert_text("\n")
+        return
+
+    if _is_simple_line(text) or _input_is_complete(text):
+        buf.validate_and_handle()
+    else:
+        buf.insert_text("\n")
+
+
+@_KEY_BINDINGS.add(Keys.BracketedPaste)
+def _handle_paste(event):
+    """Handle bracketed paste: clean up and insert the pasted text."""
+    cleaned = _clean_pasted_code(event.data)
+    event.current_buffer.insert_text(cleaned)
+
+
+@_KEY_BINDINGS.add(Keys.Escape, eager=True)
+def _handle_escape(event):
+    """Dismiss the completion menu on Escape."""
+    buf = event.current_buffer
+    if buf.complete_state:
+        buf.cancel_completion()
+
+
+@_KEY_BINDINGS.add(Keys.ControlR)
+def _reverse_search(event):
+    from prompt_toolkit.search import start_search, SearchDirection
+    start_search(direction=SearchDirection.BACKWARD)
 
 
 def register(registry):
@@ -399,113 +842,19 @@ def cmd_python(args, config, session_manager):
     namespace = _build_namespace(config, session_manager)
     completer = PythonCompleter(namespace)
 
-    console.print(
-        Panel(
-            "[bold]Python REPL Mode[/bold]\n\n"
-            "[bold]Clients[/bold] (type name to see helpers):\n"
-            "  [cyan]ec2[/cyan], [cyan]vpc[/cyan], [cyan]asg[/cyan], [cyan]s3[/cyan], "
-            "[cyan]iam[/cyan], [cyan]lam[/cyan] / [cyan]aws_lambda[/cyan], [cyan]cfn[/cyan], [cyan]sts[/cyan], "
-            "[cyan]rds[/cyan], [cyan]sqs[/cyan], [cyan]ses[/cyan], [cyan]opensearch[/cyan],\n"
-            "  [cyan]route53[/cyan], [cyan]ga_client[/cyan], [cyan]cloudfront[/cyan], "
-            "[cyan]cw[/cyan], [cyan]logs[/cyan], [cyan]secrets[/cyan], [cyan]dynamodb[/cyan],\n"
-            "  [cyan]ssm_client[/cyan], [cyan]ecs_client[/cyan], [cyan]sso_admin[/cyan], "
-            "[cyan]cache[/cyan], [cyan]cognito[/cyan], [cyan]kms[/cyan]\n\n"
-            "[bold]Examples:[/bold]\n"
-            "  [cyan]ec2.list_instances()[/cyan]                    "
-            "[dim]# Rich table output[/dim]\n"
-            "  [cyan]ec2.list_instances().filter(State=\"running\")[/cyan]  "
-            "[dim]# Filter rows[/dim]\n"
-            "  [cyan]ec2.list_instances().find(\"web\")[/cyan]           "
-            "[dim]# Fuzzy search[/dim]\n"
-            "  [cyan]ec2.list_instances().sort(\"Tags.Name\")[/cyan]     "
-            "[dim]# Sort by column[/dim]\n"
-            "  [cyan]ec2.list_instances().data[/cyan]                  "
-            "[dim]# Raw list of dicts[/dim]\n"
-            "  [cyan]ec2.list_instances().json()[/cyan]                "
-            "[dim]# JSON output[/dim]\n"
-            "  [cyan]ec2.describe_instances(InstanceIds=[...])[/cyan]  "
-            "[dim]# Direct boto3 call[/dim]\n\n"
-            "[bold]Utilities:[/bold]\n"
-            "  [cyan]docs()[/cyan]            - Overview of all clients & helpers\n"
-            "  [cyan]docs(ec2)[/cyan]         - Show helpers for a client\n"
-            "  [cyan]docs(find)[/cyan]        - Show docs for any function\n"
-            "  [cyan]find(data, kw)[/cyan]    - Fuzzy search through any data\n"
-            "  [cyan]client(name)[/cyan]      - Get any boto3 client\n"
-            "  [cyan]resource(name)[/cyan]    - Get any boto3 resource\n"
-            "  [cyan]set_region(name)[/cyan]  - Switch region (refreshes all clients)\n"
-            "  [cyan]set_profile(name)[/cyan] - Switch profile (refreshes all clients)\n\n"
-            "Type [bold]exit[/bold] or [bold]Ctrl+D[/bold] to return to AWS Shell.",
-            title="Python Mode",
-            border_style="green",
-        )
-    )
+    console.print(_HELP_PANEL)
 
     history_path = os.path.expanduser("~/.aws_shell_python_history")
-    compiler = codeop.CommandCompiler()
-
-    # Key bindings: Enter auto-submits if code is complete, otherwise adds a newline
-    # Inside indented blocks, Enter always adds a newline; submit with a blank line.
-    # Ctrl+R: reverse history search
-    bindings = KeyBindings()
-
-    @bindings.add(Keys.Enter)
-    def _handle_enter(event):
-        buf = event.current_buffer
-        text = buf.text
-
-        if not text.strip():
-            buf.validate_and_handle()
-            return
-
-        # If cursor is NOT at the end, the user is editing mid-block — just insert newline
-        if buf.cursor_position < len(text):
-            buf.insert_text("\n")
-            return
-
-        # If the last line is indented, we're inside a block — always add newline
-        last_line = text.split("\n")[-1]
-        if last_line and last_line[0] in (" ", "\t"):
-            buf.insert_text("\n")
-            return
-
-        try:
-            result = compiler(text, "<input>", "exec")
-        except (SyntaxError, OverflowError, ValueError):
-            buf.validate_and_handle()
-            return
-
-        if result is None:
-            buf.insert_text("\n")
-        else:
-            buf.validate_and_handle()
-
-    @bindings.add(Keys.BracketedPaste)
-    def _handle_paste(event):
-        """Handle bracketed paste: clean up and insert the pasted text."""
-        cleaned = _clean_pasted_code(event.data)
-        event.current_buffer.insert_text(cleaned)
-
-    @bindings.add(Keys.Escape, eager=True)
-    def _handle_escape(event):
-        """Dismiss the completion menu on Escape."""
-        buf = event.current_buffer
-        if buf.complete_state:
-            buf.cancel_completion()
-
-    @bindings.add(Keys.ControlR)
-    def _reverse_search(event):
-        from prompt_toolkit.search import start_search, SearchDirection
-        start_search(direction=SearchDirection.BACKWARD)
 
     py_session = PromptSession(
         history=FileHistory(history_path),
-        lexer=PygmentsLexer(AWSPythonLexer),
+        lexer=_aws_python_lexer(),
         completer=completer,
         style=PYTHON_STYLE,
         auto_suggest=AutoSuggestFromHistory(),
         complete_while_typing=True,
         multiline=True,
-        key_bindings=bindings,
+        key_bindings=_KEY_BINDINGS,
         prompt_continuation="... ",
     )
 
@@ -541,6 +890,7 @@ def cmd_python(args, config, session_manager):
 
             text = _rewrite_shell_style(text)
             _exec_python(text, namespace, last_exec)
+            completer.namespace_changed()
         except KeyboardInterrupt:
             console.print("\nKeyboardInterrupt")
             continue
@@ -549,6 +899,13 @@ def cmd_python(args, config, session_manager):
             break
 
 
+# Shell-style "ai <question>" (not ai(...))
+_AI_SHELL_RE = re.compile(r'^ai\s+(?!\()(.*)')
+# Trailing "| target" or "| target(args)" of a pipe expression
+_PIPE_RE = re.compile(r'\s*\|\s*(\w+(?:\(.*\))?)\s*$')
+_PIPE_TARGET_RE = re.compile(r'^(\w+)(?:\((.*)\))?$', re.DOTALL)
+
+
 def _rewrite_shell_style(text):
     """Rewrite shell-style commands to valid Python calls.
 
@@ -564,11 +921,10 @@ def _rewrite_shell_style(text):
         expr | len              →  len(expr)
         expr | json             →  expr.json() if ResourceTable, else print_json(expr)
     """
-    import re
     stripped = text.strip()
 
     # Handle ai shell-style rewrite first
-    m = re.match(r'^ai\s+(?!\()(.*)', stripped)
+    m = _AI_SHELL_RE.match(stripped) if stripped.startswith("ai") else None
     if m:
         arg = m.group(1)
         # Strip surrounding quotes if the user already wrapped them
@@ -596,11 +952,13 @@ def _rewrite_pipe(text):
     Only rewrites when the right side of | matches a known pipe target
     to avoid breaking actual bitwise OR operations.
     """
-    import re
+
+    if "|" not in text:
+        return text
 
     # Find the last | that looks like a pipe (surrounded by spaces)
     # Use a simple approach: split on ' | ' from the right
-    pipe_match = re.search(r'\s*\|\s*(\w+(?:\(.*\))?)\s*$', text)
+    pipe_match = _PIPE_RE.search(text)
     if not pipe_match:
         return text
 
@@ -611,7 +969,7 @@ def _rewrite_pipe(text):
         return text
 
     # Parse the right side: func_name and optional (args)
-    m = re.match(r'^(\w+)(?:\((.*)\))?$', pipe_expr, re.DOTALL)
+    m = _PIPE_TARGET_RE.match(pipe_expr)
     if not m:
         return text
 
@@ -697,13 +1055,38 @@ def _clean_pasted_code(code_str):
     return textwrap.dedent("\n".join(lines))
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_cached(code_str):
+    """Compile REPL input, returning (code, is_expr, error).
+
+    Parse once: a lone expression is compiled in eval mode so its value can
+    be displayed, anything else is compiled as statements. Cached because
+    the same commands are re-run over and over in a session; failures are
+    cached too so a known-bad buffer isn't re-parsed on every Enter.
+    """
+    try:
+        tree = ast.parse(code_str, "<input>", "exec")
+        if len(tree.body) == 1 and isinstance(tree.body[0], ast.Expr):
+            return compile(ast.Expression(tree.body[0].value), "<input>", "eval"), True, None
+        return compile(tree, "<input>", "exec"), False, None
+    except (SyntaxError, OverflowError, ValueError) as e:
+        return None, False, e
+
+
+def _compile_input(code_str):
+    """Compile REPL input, returning (code, is_expr); raises on bad input."""
+    code, is_expr, error = _compile_cached(code_str)
+    if error is not None:
+        # Drop the traceback left over from the last raise of this error
+        raise error.with_traceback(None)
+    return code, is_expr
+
+
 def _exec_python(code_str, namespace, last_exec=None):
-    """Execute Python code - try eval first (for expressions), fall back to exec.
+    """Execute Python code - evaluate a single expression, exec anything else.
 
     If last_exec dict is provided, stores the last code and error for ai debug.
     """
-    from ..utils.output import print_json
-
     # Clean up pasted code: strip trailing whitespace and fix indentation
     code_str = _clean_pasted_code(code_str)
 
@@ -712,25 +1095,21 @@ def _exec_python(code_str, namespace, last_exec=None):
         last_exec["error"] = None
 
     try:
-        result = eval(compile(code_str, "<input>", "eval"), namespace)
-        if result is not None:
-            if isinstance(result, ResourceTable):
-                result.render()
-            elif isinstance(result, (dict, list)):
-                try:
-                    print_json(result)
-                except (TypeError, ValueError):
+        code, is_expr = _compile_input(code_str)
+        if is_expr:
+            result = eval(code, namespace)
+            if result is not None:
+                if isinstance(result, ResourceTable):
+                    result.render()
+                elif isinstance(result, (dict, list)):
+                    try:
+                        print_json(result)
+                    except (TypeError, ValueError):
+                        print(repr(result))
+                else:
                     print(repr(result))
-            else:
-                print(repr(result))
-    except SyntaxError:
-        try:
-            exec(compile(code_str, "<input>", "exec"), namespace)
-        except Exception:
-            error_str = traceback.format_exc()
-            if last_exec is not None:
-                last_exec["error"] = error_str
-            traceback.print_exc()
+        else:
+            exec(code, namespace)
     except Exception:
         error_str = traceback.format_exc()
         if last_exec is not None:
@@ -744,33 +1123,38 @@ def cmd_exec(args, config, session_manager):
         console.print("[dim]Example: exec ec2.list_instances()[/dim]")
         return
 
-    namespace = _build_namespace(config, session_manager)
+    namespace = _exec_namespace(config, session_manager)
     expression = " ".join(args)
 
     try:
-        result = eval(expression, namespace)
+        # One parse decides between eval (show the value) and exec
+        code, is_expr = _compile_input(expression)
+        if not is_expr:
+            exec(code, namespace)
+            return
+        result = eval(code, namespace)
         if result is not None:
             if isinstance(result, ResourceTable):
                 result.render()
             else:
-                from ..utils.output import print_json
                 try:
                     print_json(result)
                 except (TypeError, ValueError):
                     console.print(repr(result))
-    except SyntaxError:
-        try:
-            exec(expression, namespace)
-        except Exception as e:
-            console.print(f"[bold red]Error:[/bold red] {e}")
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
 
 
-def _build_namespace(config, session_manager):
-    import boto3
-    from ..utils.search import fuzzy_search
+def _exec_namespace(config, session_manager):
+    """Return the namespace for exec, reused while profile and region are unchanged."""
+    key = (config.profile, config.region)
+    if getattr(session_manager, "_ns_cache_key", None) != key:
+        session_manager._ns_cache = _build_namespace(config, session_manager)
+        session_manager._ns_cache_key = key
+    return session_manager._ns_cache
+
 
+def _build_namespace(config, session_manager):
     namespace = {}
 
     def get_client(service_name):
@@ -796,7 +1180,7 @@ def _build_namespace(config, session_manager):
         if isinstance(data, ResourceTable):
             return data.find(keyword)
 
-        results = fuzzy_search(data, keyword)
+        results = fuzzy_search(data, keyword, max_value_len=120)
         if not results:
             console.print(f"[yellow]No matches for '{keyword}'[/yellow]")
             return
@@ -806,11 +1190,59 @@ def _build_namespace(config, session_manager):
             text = Text()
             text.append(f"  {path}", style="cyan")
             text.append(" \u2192 ", style="dim")
-            display = value if len(value) <= 120 else value[:117] + "..."
-            text.append(display)
+            text.append(value)
             console.print(text)
         console.print(f"\n[dim]{len(results)} match(es)[/dim]")
 
+    def list_all(*names):
+        """Run every no-argument list_* helper concurrently and render the tables.
+
+        Each helper is one or more independent API round trips, so they are
+        fetched in parallel and printed in client order once done. Helpers
+        that take any parameter are skipped, even if all of them are
+        optional (e.g. ec2.list_subnets(vpc_id=None)): without an argument
+        some of them fan out over every resource. Call those directly.
+        Only ResourceTable results are rendered; a message a helper prints
+        itself (e.g. "No SSO instance found") may appear out of order.
+
+        Examples:
+            list_all()              # every client
+            list_all("ec2", "s3")   # only these clients
+        """
+        calls = []
+        seen = set()
+        for key, val in namespace.items():
+            if not isinstance(val, ServiceHelper) or (names and key not in names):
+                continue
+            queued = len(calls)
+            for attr, func in sorted(val._helpers.items()):
+                if (attr.startswith("list_") and callable(func) and func not in seen
+                        and not inspect.signature(func).parameters):
+                    seen.add(func)
+                    calls.append((f"{key}.{attr}", func))
+            if len(calls) > queued:
+                # Clients are built lazily; create them here rather than
+                # concurrently from the shared session inside the workers
+                _ = val._client
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [(label, pool.submit(func)) for label, func in calls]
+            for label, future in futures:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    console.print(f"[bold red]{label}:[/bold red] {e}")
+                    continue
+                # Helpers that find nothing to list may return None
+                if result is None:
+                    continue
+                if isinstance(result, ResourceTable):
+                    result.render()
+
+    def refresh():
+        """Drop cached list_* results so the next call hits the API again."""
+        api_cache.clear()
+
     # Categories for grouping boto3 methods
     _METHOD_CATEGORIES = [
         ("list",     ["list_", "get_paginator"]),
@@ -844,10 +1276,7 @@ def _build_namespace(config, session_manager):
             clients = []
             for key, val in sorted(namespace.items()):
                 if isinstance(val, ServiceHelper):
-                    helpers = sorted(
-                        k for k in val.__dict__
-                        if not k.startswith('_') and callable(val.__dict__[k])
-                    )
+                    helpers = val.helper_names()
                     helpers_str = ", ".join(f"[cyan].{h}()[/cyan]" for h in helpers) if helpers else "[dim]no helpers[/dim]"
                     clients.append((f"[bold]{key}[/bold]", helpers_str))
 
@@ -858,47 +1287,25 @@ def _build_namespace(config, session_manager):
                 table.add_row(name, helpers)
             console.print(table)
 
-            console.print(Panel(
-                "[bold]Utilities:[/bold]\n"
-                "  [cyan]find(data, kw)[/cyan]    Fuzzy search through any data\n"
-                "  [cyan]docs()[/cyan]            Show this overview\n"
-                "  [cyan]docs(ec2)[/cyan]         Show helpers + grouped boto3 methods\n"
-                "  [cyan]docs(ec2, 'list')[/cyan] Filter by category (list/describe/create/update/delete)\n"
-                "  [cyan]ec2 | help('list')[/cyan] Same via pipe syntax\n"
-                "  [cyan]docs(find)[/cyan]        Show docs for a function\n"
-                "  [cyan]client(name)[/cyan]      Get any boto3 client\n"
-                "  [cyan]resource(name)[/cyan]    Get any boto3 resource\n"
-                "  [cyan]set_region(name)[/cyan]  Switch region\n"
-                "  [cyan]set_profile(name)[/cyan] Switch profile\n\n"
-                "[bold]Table Methods[/bold] (call [cyan].help()[/cyan] on any table):\n"
-                "  [cyan].filter()[/cyan] [cyan].find()[/cyan] [cyan].sort()[/cyan] "
-                "[cyan].select()[/cyan] [cyan].data[/cyan] [cyan].json()[/cyan] [cyan].help()[/cyan]\n\n"
-                "[bold]Pipe Syntax:[/bold]\n"
-                "  [cyan]expr | find('kw')[/cyan]  [cyan]expr | docs[/cyan]  "
-                "[cyan]expr | keys[/cyan]  [cyan]expr | raw[/cyan]  [cyan]expr | len[/cyan]",
-                title="Quick Reference",
-                border_style="green",
-            ))
+            console.print(_DOCS_REFERENCE_PANEL)
             return
 
         if isinstance(obj, ServiceHelper):
             # Get all boto3 client methods
-            client_methods = sorted(
-                a for a in dir(obj._client)
-                if not a.startswith('_') and callable(getattr(obj._client, a, None))
+            client_methods = [
+                a for a in _callable_names(obj._client)
+                if not a.startswith('_')
                 and a not in ("can_paginate", "generate_presigned_url", "get_waiter", "get_paginator", "exceptions", "meta")
-            )
+            ]
+            client_methods.sort()
 
             # Show helper methods first
-            helpers = sorted(
-                k for k in obj.__dict__
-                if not k.startswith('_') and callable(obj.__dict__[k])
-            )
+            helpers = obj.helper_names()
             lines = [f"[bold]{obj._name}[/bold] client\n"]
             if helpers and not filter_keyword:
                 lines.append("[bold green]Helper methods:[/bold green]")
                 for h in helpers:
-                    func = obj.__dict__[h]
+                    func = obj._helpers[h]
                     doc = (func.__doc__ or "").strip().split("\n")[0]
                     lines.append(f"  [cyan]{obj._name}.{h}()[/cyan]  {doc}")
                 lines.append("")
@@ -966,7 +1373,6 @@ def _build_namespace(config, session_manager):
             return
 
         if callable(obj):
-            import inspect
             name = getattr(obj, '__name__', str(obj))
             doc = inspect.getdoc(obj) or "No documentation available."
             try:
@@ -976,19 +1382,18 @@ def _build_namespace(config, session_manager):
 
             lines = [f"[bold cyan]{name}[/bold cyan][dim]{sig}[/dim]\n\n{doc}"]
 
-            # If this is a boto3 method wrapper from ServiceHelper, show params
-            # Check if the function has a __name__ that maps to a boto3 operation
+            # If this is a boto3 client method (or a ServiceHelper wrapper
+            # around one), show its params. The bound client is reachable
+            # from the method itself, so no other client gets built.
             func_name = getattr(obj, '__name__', '')
-            # Try to find the client this method belongs to by checking namespace
-            for ns_name, ns_val in namespace.items():
-                if isinstance(ns_val, ServiceHelper):
-                    boto3_params = _get_boto3_params(ns_val._client, func_name)
-                    if boto3_params is not None:
-                        lines.append("\n[bold]Parameters:[/bold]")
-                        for pname, is_req, type_name in boto3_params:
-                            req_tag = " [bold red](required)[/bold red]" if is_req else ""
-                            lines.append(f"  [cyan]{pname}[/cyan] [dim]{type_name}[/dim]{req_tag}")
-                        break
+            client = getattr(getattr(obj, '__wrapped__', obj), '__self__', None)
+            if _is_boto3_client(client):
+                boto3_params = _get_boto3_params(client, func_name)
+                if boto3_params is not None:
+                    lines.append("\n[bold]Parameters:[/bold]")
+                    for pname, is_req, type_name in boto3_params:
+                        req_tag = " [bold red](required)[/bold red]" if is_req else ""
+                        lines.append(f"  [cyan]{pname}[/cyan] [dim]{type_name}[/dim]{req_tag}")
 
             console.print(Panel(
                 "\n".join(lines),
@@ -1004,8 +1409,10 @@ def _build_namespace(config, session_manager):
 
     def smart_print(*args, **kwargs):
         """Print with auto-prettified JSON for dicts and lists."""
-        from ..utils.output import print_json
-        if len(args) == 1 and not kwargs.get("file") and isinstance(args[0], (dict, list)):
+        # Cheapest checks first; most prints are a single non-container
+        # value with no keyword arguments
+        if (len(args) == 1 and isinstance(args[0], (dict, list))
+                and not (kwargs and kwargs.get("file"))):
             try:
                 print_json(args[0])
             except (TypeError, ValueError):
@@ -1071,6 +1478,8 @@ def _build_namespace(config, session_manager):
         "raw": raw,
         "clear": clear,
         "find": find,
+        "list_all": list_all,
+        "refresh": refresh,
         "docs": docs,
         "help": docs,
         "client": get_client,
@@ -1090,89 +1499,180 @@ def _build_namespace(config, session_manager):
 # Helper factories for concise service helper creation
 # ---------------------------------------------------------------------------
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _fmt_bytes(val):
+    """Format a byte count as human-readable, e.g. 1536 -> '1.5 KB'."""
+    # Each unit is 2**10 of the previous one, so the bit length of the
+    # integer part picks the unit directly — no repeated division
+    i = min(max(int(val).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+    return f"{val / (1 << (10 * i)):.1f} {_BYTE_UNITS[i]}"
+
+
+# (metric name, unit, statistic) shown by ec2.get_metrics(), in row order
+_EC2_METRICS = (
+    ("CPUUtilization", "Percent", "Average"),
+    ("NetworkIn", "Bytes", "Sum"),
+    ("NetworkOut", "Bytes", "Sum"),
+    ("DiskReadOps", "Count", "Sum"),
+    ("DiskWriteOps", "Count", "Sum"),
+    ("StatusCheckFailed", "Count", "Maximum"),
+    ("StatusCheckFailed_Instance", "Count", "Maximum"),
+    ("StatusCheckFailed_System", "Count", "Maximum"),
+)
+
+# ec2.get_cpu()'s two series; no unit filter, as CPUUtilization has only one
+_EC2_CPU_METRICS = (
+    ("CPUUtilization", None, "Average"),
+    ("CPUUtilization", None, "Maximum"),
+)
+
+
+def _iter_pages(pages, key):
+    """Chain the `key` lists of every page into one iterator."""
+    return itertools.chain.from_iterable(page.get(key, ()) for page in pages)
+
+
+def _collect_pages(pages, key):
+    """Collect the `key` lists of every page into one list."""
+    return list(_iter_pages(pages, key))
+
+
 def _paginated_helper(sm, service, method, key, columns=None, title=None, **extra):
-    """Factory: create a helper that paginates an API call and returns ResourceTable."""
+    """Factory: create a helper that paginates an API call and returns ResourceTable.
+
+    Results are cached for API_CACHE_TTL seconds; refresh() clears them.
+    """
+    call_key = (service, method, tuple(sorted(extra.items())))
+
+    def fetch():
+        pages = get_paginator(sm.client(service), method).paginate(**extra)
+        return tuple(_iter_pages(pages, key))
+
     def helper():
-        c = sm.client(service)
-        items = []
-        for page in c.get_paginator(method).paginate(**extra):
-            items.extend(page.get(key, []))
-        return ResourceTable(items, columns=columns, title=title)
+        return ResourceTable(cached_call(sm, call_key, fetch), columns=columns, title=title)
     return helper
 
 
 def _simple_helper(sm, service, method, key_path, columns=None, title=None, **call_kwargs):
-    """Factory: create a helper that makes a single API call and returns ResourceTable."""
-    def helper():
-        c = sm.client(service)
-        result = getattr(c, method)(**call_kwargs)
-        data = result
-        for k in key_path.split("."):
-            data = data.get(k, []) if isinstance(data, dict) else data
+    """Factory: create a helper that makes a single API call and returns ResourceTable.
+
+    Results are cached like _paginated_helper's.
+    """
+    keys = tuple(key_path.split("."))
+    # Every helper so far reads a single top-level key; skip the walk then
+    single_key = keys[0] if len(keys) == 1 else None
+    call_key = (service, method, tuple(sorted(call_kwargs.items())))
+
+    def fetch():
+        data = getattr(sm.client(service), method)(**call_kwargs)
+        if single_key is not None:
+            data = data.get(single_key, [])
+        else:
+            for k in keys:
+                data = data.get(k, []) if isinstance(data, dict) else data
         if not isinstance(data, list):
             data = [data] if data else []
-        return ResourceTable(data, columns=columns, title=title)
+        return tuple(data)
+
+    def helper():
+        return ResourceTable(cached_call(sm, call_key, fetch), columns=columns, title=title)
     return helper
 
 
-def _format_sg_rules(rules):
-    """Format security group rules into a readable multi-line string."""
-    lines = []
-    for rule in rules:
-        proto = rule.get("IpProtocol", "")
-        if proto == "-1":
-            port_str = "All traffic"
-        elif rule.get("FromPort") == rule.get("ToPort"):
-            port_str = f"{rule['FromPort']}/{proto}"
-        else:
-            port_str = f"{rule.get('FromPort')}-{rule.get('ToPort')}/{proto}"
+# Rule source lists and the id field shown for each entry
+_SG_SOURCE_KEYS = (
+    ("IpRanges", "CidrIp"),
+    ("Ipv6Ranges", "CidrIpv6"),
+    ("UserIdGroupPairs", "GroupId"),
+)
 
-        # Collect all sources/destinations
-        sources = []
-        for cidr in rule.get("IpRanges", []):
-            desc = cidr.get("Description", "")
-            label = f"{cidr['CidrIp']}"
-            if desc:
-                label += f" ({desc})"
-            sources.append(label)
-        for cidr in rule.get("Ipv6Ranges", []):
-            desc = cidr.get("Description", "")
-            label = f"{cidr['CidrIpv6']}"
-            if desc:
-                label += f" ({desc})"
-            sources.append(label)
-        for sg_ref in rule.get("UserIdGroupPairs", []):
-            desc = sg_ref.get("Description", "")
-            label = f"{sg_ref['GroupId']}"
+
+def _sg_rule_lines(rule):
+    """Yield one display line per source/destination of a security group rule."""
+    proto = rule.get("IpProtocol", "")
+    if proto == "-1":
+        port_str = "All traffic"
+    elif rule.get("FromPort") == rule.get("ToPort"):
+        port_str = f"{rule['FromPort']}/{proto}"
+    else:
+        port_str = f"{rule.get('FromPort')}-{rule.get('ToPort')}/{proto}"
+
+    for list_key, id_key in _SG_SOURCE_KEYS:
+        for ref in rule.get(list_key, ()):
+            desc = ref.get("Description", "")
             if desc:
-                label += f" ({desc})"
-            sources.append(label)
-        for pl in rule.get("PrefixListIds", []):
-            sources.append(pl.get("PrefixListId", ""))
+                yield f"{ref[id_key]} ({desc}) \u2192 {port_str}"
+            else:
+                yield f"{ref[id_key]} \u2192 {port_str}"
+    for pl in rule.get("PrefixListIds", ()):
+        yield f"{pl.get('PrefixListId', '')} \u2192 {port_str}"
+
 
-        for src in sources:
-            lines.append(f"{src} \u2192 {port_str}")
+def _format_sg_rules(rules):
+    """Format security group rules into a readable multi-line string."""
+    return "\n".join(itertools.chain.from_iterable(map(_sg_rule_lines, rules))) or "None"
 
-    return "\n".join(lines) if lines else "None"
+
+def _annotate_sg(sg):
+    """Add the _Inbound/_Outbound display columns to a security group."""
+    sg["_Inbound"] = _format_sg_rules(sg.get("IpPermissions", ()))
+    sg["_Outbound"] = _format_sg_rules(sg.get("IpPermissionsEgress", ()))
+    return sg
 
 
 # ---------------------------------------------------------------------------
 # Service helpers — each service gets a ServiceHelper with attached methods
 # ---------------------------------------------------------------------------
 
+# Namespace name, ServiceHelper display name, boto3 service name — one
+# entry per pre-loaded client in the Python REPL.
+_SERVICE_CLIENTS = (
+    ("ec2", "ec2", "ec2"),
+    ("vpc", "vpc", "ec2"),
+    ("asg", "asg", "autoscaling"),
+    ("s3", "s3", "s3"),
+    ("iam", "iam", "iam"),
+    ("lam", "lambda", "lambda"),
+    ("cfn", "cfn", "cloudformation"),
+    ("sts", "sts", "sts"),
+    ("rds", "rds", "rds"),
+    ("sqs", "sqs", "sqs"),
+    ("ses", "ses", "sesv2"),
+    ("opensearch", "opensearch", "opensearch"),
+    ("route53", "route53", "route53"),
+    ("ga_client", "ga", "globalaccelerator"),
+    ("cloudfront", "cloudfront", "cloudfront"),
+    ("cw", "cw", "cloudwatch"),
+    ("logs", "logs", "logs"),
+    ("secrets", "secrets", "secretsmanager"),
+    ("dynamodb", "dynamodb", "dynamodb"),
+    ("ssm_client", "ssm", "ssm"),
+    ("ecs_client", "ecs", "ecs"),
+    ("sso_admin", "sso_admin", "sso-admin"),
+    ("cache", "cache", "elasticache"),
+    ("cognito", "cognito", "cognito-idp"),
+    ("kms", "kms", "kms"),
+)
+
+
 def _attach_service_helpers(namespace, session_manager):
     """Create ServiceHelper objects with convenience methods for all services."""
     sm = session_manager
+    helpers = {
+        name: ServiceHelper(label, functools.partial(sm.client, service))
+        for name, label, service in _SERVICE_CLIENTS
+    }
 
     # --- EC2 ---
-    ec2 = ServiceHelper("ec2", sm.client("ec2"))
+    ec2 = helpers["ec2"]
 
     def _ec2_list_instances():
-        c = sm.client("ec2")
-        instances = []
-        for page in c.get_paginator("describe_instances").paginate():
-            for res in page["Reservations"]:
-                instances.extend(res["Instances"])
+        pages = get_paginator(sm.client("ec2"), "describe_instances").paginate()
+        instances = list(itertools.chain.from_iterable(
+            res["Instances"] for page in pages for res in page["Reservations"]
+        ))
         return ResourceTable(instances, columns=[
             ("InstanceId", "Instance ID", "cyan"),
             ("Tags.Name", "Name", "green"),
@@ -1205,10 +1705,7 @@ def _attach_service_helpers(namespace, session_manager):
     def _ec2_list_security_groups(vpc_id=None):
         c = sm.client("ec2")
         kwargs = {"Filters": [{"Name": "vpc-id", "Values": [vpc_id]}]} if vpc_id else {}
-        sgs = c.describe_security_groups(**kwargs)["SecurityGroups"]
-        for sg in sgs:
-            sg["_Inbound"] = _format_sg_rules(sg.get("IpPermissions", []))
-            sg["_Outbound"] = _format_sg_rules(sg.get("IpPermissionsEgress", []))
+        sgs = list(map(_annotate_sg, c.describe_security_groups(**kwargs)["SecurityGroups"]))
         return ResourceTable(
             sgs,
             columns=[("GroupId", "Group ID", "cyan"), ("GroupName", "Name", "green"),
@@ -1220,6 +1717,55 @@ def _attach_service_helpers(namespace, session_manager):
             title="Security Groups",
         )
 
+    def _ec2_metric_series(instance_id, metrics, hours, period):
+        """Fetch AWS/EC2 series for one instance with a single GetMetricData call.
+
+        `metrics` is a tuple of (metric name, unit or None, statistic).
+        Returns one (timestamps, values) pair per metric, newest first.
+        Cached briefly, like the list helpers, so re-running get_metrics
+        or get_cpu doesn't go back to CloudWatch.
+        """
+        from datetime import datetime, timedelta, timezone
+
+        def fetch():
+            end = datetime.now(timezone.utc)
+            start = end - timedelta(hours=hours)
+            dimensions = [{"Name": "InstanceId", "Value": instance_id}]
+            queries = []
+            for i, (metric_name, unit, stat) in enumerate(metrics):
+                metric_stat = {
+                    "Metric": {
+                        "Namespace": "AWS/EC2",
+                        "MetricName": metric_name,
+                        "Dimensions": dimensions,
+                    },
+                    "Period": period,
+                    "Stat": stat,
+                }
+                if unit:
+                    metric_stat["Unit"] = unit
+                queries.append({"Id": f"m{i}", "MetricStat": metric_stat, "ReturnData": True})
+
+            # Id -> (timestamps, values); a series can continue on a later page
+            series = {q["Id"]: ([], []) for q in queries}
+            paginator = get_paginator(sm.client("cloudwatch"), "get_metric_data")
+            for page in paginator.paginate(
+                MetricDataQueries=queries, StartTime=start, EndTime=end,
+                ScanBy="TimestampDescending",
+            ):
+                for result in page.get("MetricDataResults", []):
+                    timestamps, values = series[result["Id"]]
+                    timestamps.extend(result.get("Timestamps", []))
+                    values.extend(result.get("Values", []))
+            return tuple(
+                (tuple(timestamps), tuple(values))
+                for timestamps, values in (series[f"m{i}"] for i in range(len(metrics)))
+            )
+
+        return cached_call(
+            sm, ("cloudwatch", "get_metric_data", instance_id, metrics, hours, period), fetch,
+        )
+
     def _ec2_get_metrics(instance_id, hours=1):
         """Get CloudWatch metrics for an EC2 instance.
 
@@ -1229,68 +1775,36 @@ def _attach_service_helpers(namespace, session_manager):
 
         Returns ResourceTable with CPU, Network, Disk, and Status metrics.
         """
-        from datetime import datetime, timedelta, timezone
-
-        cw_client = sm.client("cloudwatch")
-        end = datetime.now(timezone.utc)
-        start = end - timedelta(hours=hours)
         period = max(300, (hours * 3600) // 12)  # ~12 data points
-
-        metrics = [
-            ("CPUUtilization", "Percent", "Average"),
-            ("NetworkIn", "Bytes", "Sum"),
-            ("NetworkOut", "Bytes", "Sum"),
-            ("DiskReadOps", "Count", "Sum"),
-            ("DiskWriteOps", "Count", "Sum"),
-            ("StatusCheckFailed", "Count", "Maximum"),
-            ("StatusCheckFailed_Instance", "Count", "Maximum"),
-            ("StatusCheckFailed_System", "Count", "Maximum"),
-        ]
-
-        rows = []
-        for metric_name, unit, stat in metrics:
-            resp = cw_client.get_metric_statistics(
-                Namespace="AWS/EC2",
-                MetricName=metric_name,
-                Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                StartTime=start,
-                EndTime=end,
-                Period=period,
-                Statistics=[stat],
-                Unit=unit,
-            )
-            datapoints = sorted(resp.get("Datapoints", []), key=lambda d: d["Timestamp"])
-            if datapoints:
-                latest = datapoints[-1]
-                val = latest[stat]
-                # Format bytes as human-readable
-                if unit == "Bytes" and val > 0:
-                    for u in ["B", "KB", "MB", "GB"]:
-                        if val < 1024:
-                            formatted = f"{val:.1f} {u}"
-                            break
-                        val /= 1024
-                    else:
-                        formatted = f"{val:.1f} TB"
-                elif unit == "Percent":
-                    formatted = f"{val:.1f}%"
-                else:
-                    formatted = f"{val:.0f}"
-                rows.append({
-                    "Metric": metric_name,
-                    "Latest": formatted,
-                    "Stat": stat,
-                    "Datapoints": len(datapoints),
-                    "Timestamp": latest["Timestamp"].strftime("%H:%M:%S"),
-                })
-            else:
-                rows.append({
+        series = _ec2_metric_series(instance_id, _EC2_METRICS, hours, period)
+
+        # One row per metric, filled in place in _EC2_METRICS order
+        rows = [None] * len(_EC2_METRICS)
+        for i, (metric_name, unit, stat) in enumerate(_EC2_METRICS):
+            timestamps, values = series[i]
+            if not timestamps:
+                rows[i] = {
                     "Metric": metric_name,
                     "Latest": "-",
                     "Stat": stat,
                     "Datapoints": 0,
                     "Timestamp": "-",
-                })
+                }
+                continue
+            val = values[0]
+            if unit == "Bytes" and val > 0:
+                formatted = _fmt_bytes(val)
+            elif unit == "Percent":
+                formatted = f"{val:.1f}%"
+            else:
+                formatted = f"{val:.0f}"
+            rows[i] = {
+                "Metric": metric_name,
+                "Latest": formatted,
+                "Stat": stat,
+                "Datapoints": len(timestamps),
+                "Timestamp": timestamps[0].time().isoformat("seconds"),
+            }
 
         return ResourceTable(rows, columns=[
             ("Metric", "Metric", "cyan"),
@@ -1305,29 +1819,20 @@ def _attach_service_helpers(namespace, session_manager):
 
         Returns a time series of CPU usage at 5-minute intervals.
         """
-        from datetime import datetime, timedelta, timezone
-
-        cw_client = sm.client("cloudwatch")
-        end = datetime.now(timezone.utc)
-        start = end - timedelta(hours=hours)
-
-        resp = cw_client.get_metric_statistics(
-            Namespace="AWS/EC2",
-            MetricName="CPUUtilization",
-            Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-            StartTime=start,
-            EndTime=end,
-            Period=300,
-            Statistics=["Average", "Maximum"],
+        (avg_ts, avg_vals), (max_ts, max_vals) = _ec2_metric_series(
+            instance_id, _EC2_CPU_METRICS, hours, 300,
         )
-
-        datapoints = sorted(resp.get("Datapoints", []), key=lambda d: d["Timestamp"])
+        maxima = dict(zip(max_ts, max_vals))
+        # Series come newest first; the table reads oldest to newest
         rows = []
-        for dp in datapoints:
+        for ts, avg in zip(reversed(avg_ts), reversed(avg_vals)):
+            peak = maxima.get(ts)
             rows.append({
-                "Time": dp["Timestamp"].strftime("%Y-%m-%d %H:%M"),
-                "Average": f"{dp['Average']:.1f}%",
-                "Maximum": f"{dp['Maximum']:.1f}%",
+                # isoformat is several times cheaper than strftime; drop the
+                # UTC offset it appends to keep "YYYY-MM-DD HH:MM"
+                "Time": ts.isoformat(" ", "minutes")[:16],
+                "Average": f"{avg:.1f}%",
+                "Maximum": f"{peak:.1f}%" if peak is not None else "-",
             })
 
         return ResourceTable(rows, columns=[
@@ -1342,30 +1847,26 @@ def _attach_service_helpers(namespace, session_manager):
     ec2.list_security_groups = _ec2_list_security_groups
     ec2.get_metrics = _ec2_get_metrics
     ec2.get_cpu = _ec2_get_cpu
-    namespace["ec2"] = ec2
 
     # --- VPC (wraps ec2 client, VPC-focused helpers) ---
-    vpc = ServiceHelper("vpc", sm.client("ec2"))
+    vpc = helpers["vpc"]
     vpc.list_vpcs = _ec2_list_vpcs
     vpc.list_subnets = _ec2_list_subnets
     vpc.list_security_groups = _ec2_list_security_groups
-    namespace["vpc"] = vpc
 
     # --- ASG (Auto Scaling Groups) ---
-    asg = ServiceHelper("asg", sm.client("autoscaling"))
+    asg = helpers["asg"]
 
     def _asg_list_groups():
         c = sm.client("autoscaling")
-        groups = []
-        for page in c.get_paginator("describe_auto_scaling_groups").paginate():
-            groups.extend(page["AutoScalingGroups"])
+        groups = _collect_pages(
+            get_paginator(c, "describe_auto_scaling_groups").paginate(), "AutoScalingGroups"
+        )
         for g in groups:
-            g["_Instances"] = len(g.get("Instances", []))
-            health = {}
-            for inst in g.get("Instances", []):
-                h = inst.get("HealthStatus", "Unknown")
-                health[h] = health.get(h, 0) + 1
-            g["_Health"] = ", ".join(f"{v} {k}" for k, v in health.items()) if health else "-"
+            instances = g.get("Instances", [])
+            g["_Instances"] = len(instances)
+            health = Counter(inst.get("HealthStatus", "Unknown") for inst in instances)
+            g["_Health"] = ", ".join(f"{v} {k}" for k, v in health.items()) or "-"
         return ResourceTable(groups, columns=[
             ("AutoScalingGroupName", "ASG Name", "green"),
             ("MinSize", "Min", "yellow"),
@@ -1379,9 +1880,9 @@ def _attach_service_helpers(namespace, session_manager):
 
     def _asg_list_instances():
         c = sm.client("autoscaling")
-        instances = []
-        for page in c.get_paginator("describe_auto_scaling_instances").paginate():
-            instances.extend(page["AutoScalingInstances"])
+        instances = _collect_pages(
+            get_paginator(c, "describe_auto_scaling_instances").paginate(), "AutoScalingInstances"
+        )
         return ResourceTable(instances, columns=[
             ("InstanceId", "Instance ID", "cyan"),
             ("AutoScalingGroupName", "ASG Name", "green"),
@@ -1394,9 +1895,9 @@ def _attach_service_helpers(namespace, session_manager):
     def _asg_list_activities(asg_name=None):
         c = sm.client("autoscaling")
         kwargs = {"AutoScalingGroupName": asg_name} if asg_name else {}
-        activities = []
-        for page in c.get_paginator("describe_scaling_activities").paginate(**kwargs):
-            activities.extend(page["Activities"])
+        activities = _collect_pages(
+            get_paginator(c, "describe_scaling_activities").paginate(**kwargs), "Activities"
+        )
         return ResourceTable(activities[:50], columns=[
             ("AutoScalingGroupName", "ASG Name", "green"),
             ("StatusCode", "Status", "bold"),
@@ -1408,20 +1909,26 @@ def _attach_service_helpers(namespace, session_manager):
     asg.list_groups = _asg_list_groups
     asg.list_instances = _asg_list_instances
     asg.list_activities = _asg_list_activities
-    namespace["asg"] = asg
 
     # --- S3 ---
-    s3 = ServiceHelper("s3", sm.client("s3"))
+    s3 = helpers["s3"]
+
+    def _s3_buckets():
+        # Shared by both bucket helpers
+        return cached_call(
+            sm, ("s3", "list_buckets"),
+            lambda: tuple(sm.client("s3").list_buckets().get("Buckets", [])),
+        )
 
     def _s3_list_buckets():
         return ResourceTable(
-            sm.client("s3").list_buckets().get("Buckets", []),
+            _s3_buckets(),
             columns=[("Name", "Bucket Name"), ("CreationDate", "Created")],
             title="S3 Buckets",
         )
 
     def _s3_list_bucket_names():
-        buckets = sm.client("s3").list_buckets().get("Buckets", [])
+        buckets = _s3_buckets()
         return ResourceTable(
             [b["Name"] for b in buckets],
             title="S3 Bucket Names",
@@ -1429,10 +1936,9 @@ def _attach_service_helpers(namespace, session_manager):
 
     s3.list_buckets = _s3_list_buckets
     s3.list_bucket_names = _s3_list_bucket_names
-    namespace["s3"] = s3
 
     # --- IAM ---
-    iam = ServiceHelper("iam", sm.client("iam"))
+    iam = helpers["iam"]
     iam.list_users = _paginated_helper(sm, "iam", "list_users", "Users",
         columns=[("UserName", "User"), ("UserId", "User ID"),
                  ("Arn", "ARN"), ("CreateDate", "Created")],
@@ -1445,16 +1951,13 @@ def _attach_service_helpers(namespace, session_manager):
         columns=[("PolicyName", "Policy"), ("PolicyId", "Policy ID"),
                  ("AttachmentCount", "Attachments"), ("CreateDate", "Created")],
         title="IAM Policies", Scope="Local")
-    namespace["iam"] = iam
 
     # --- Lambda ---
-    lam = ServiceHelper("lambda", sm.client("lambda"))
+    lam = helpers["lam"]
 
-    def _lambda_list_functions():
+    def _lambda_fetch_functions():
         c = sm.client("lambda")
-        functions = []
-        for page in c.get_paginator("list_functions").paginate():
-            functions.extend(page.get("Functions", []))
+        functions = _collect_pages(get_paginator(c, "list_functions").paginate(), "Functions")
         for f in functions:
             # Build a "Code" column: runtime for Zip, image repo for Image
             if f.get("PackageType") == "Image":
@@ -1469,6 +1972,10 @@ def _attach_service_helpers(namespace, session_manager):
                     f["_Code"] = image_uri.split("/")[-1] if "/" in image_uri else image_uri
             else:
                 f["_Code"] = f.get("Runtime", "")
+        return tuple(functions)
+
+    def _lambda_list_functions():
+        functions = cached_call(sm, ("lambda", "list_functions"), _lambda_fetch_functions)
         return ResourceTable(functions, columns=[
             ("FunctionName", "Function", "cyan"),
             ("_Code", "Runtime / Image", "yellow"),
@@ -1480,24 +1987,18 @@ def _attach_service_helpers(namespace, session_manager):
         ], title="Lambda Functions")
 
     lam.list_functions = _lambda_list_functions
-    namespace["lam"] = lam
-    namespace["aws_lambda"] = lam
 
     # --- CloudFormation ---
-    cfn = ServiceHelper("cfn", sm.client("cloudformation"))
+    cfn = helpers["cfn"]
     cfn.list_stacks = _paginated_helper(
         sm, "cloudformation", "list_stacks", "StackSummaries",
         columns=[("StackName", "Stack"), ("StackStatus", "Status"),
                  ("CreationTime", "Created")],
         title="CloudFormation Stacks",
         StackStatusFilter=["CREATE_COMPLETE", "UPDATE_COMPLETE", "ROLLBACK_COMPLETE"])
-    namespace["cfn"] = cfn
-
-    # --- STS (no helpers) ---
-    namespace["sts"] = ServiceHelper("sts", sm.client("sts"))
 
     # --- RDS ---
-    rds = ServiceHelper("rds", sm.client("rds"))
+    rds = helpers["rds"]
     rds.list_instances = _paginated_helper(
         sm, "rds", "describe_db_instances", "DBInstances",
         columns=[("DBInstanceIdentifier", "DB Instance"), ("DBInstanceClass", "Class"),
@@ -1508,10 +2009,9 @@ def _attach_service_helpers(namespace, session_manager):
         columns=[("DBClusterIdentifier", "Cluster"), ("Engine", "Engine"),
                  ("Status", "Status"), ("Endpoint", "Endpoint")],
         title="RDS Clusters")
-    namespace["rds"] = rds
 
     # --- SQS ---
-    sqs = ServiceHelper("sqs", sm.client("sqs"))
+    sqs = helpers["sqs"]
 
     def _sqs_list_queues():
         return ResourceTable(
@@ -1520,33 +2020,24 @@ def _attach_service_helpers(namespace, session_manager):
         )
 
     sqs.list_queues = _sqs_list_queues
-    namespace["sqs"] = sqs
-
-    # --- SES (no helpers) ---
-    namespace["ses"] = ServiceHelper("ses", sm.client("sesv2"))
 
     # --- OpenSearch ---
-    opensearch = ServiceHelper("opensearch", sm.client("opensearch"))
+    opensearch = helpers["opensearch"]
     opensearch.list_domains = _simple_helper(
         sm, "opensearch", "list_domain_names", "DomainNames",
         columns=[("DomainName", "Domain")],
         title="OpenSearch Domains")
-    namespace["opensearch"] = opensearch
 
     # --- Route 53 ---
-    route53 = ServiceHelper("route53", sm.client("route53"))
+    route53 = helpers["route53"]
     route53.list_hosted_zones = _simple_helper(
         sm, "route53", "list_hosted_zones", "HostedZones",
         columns=[("Name", "Name"), ("Id", "Zone ID"),
                  ("ResourceRecordSetCount", "Records")],
         title="Route 53 Hosted Zones")
-    namespace["route53"] = route53
-
-    # --- Global Accelerator (no helpers) ---
-    namespace["ga_client"] = ServiceHelper("ga", sm.client("globalaccelerator"))
 
     # --- CloudFront ---
-    cloudfront = ServiceHelper("cloudfront", sm.client("cloudfront"))
+    cloudfront = helpers["cloudfront"]
 
     def _cf_list_distributions():
         resp = sm.client("cloudfront").list_distributions()
@@ -1557,37 +2048,33 @@ def _attach_service_helpers(namespace, session_manager):
             title="CloudFront Distributions")
 
     cloudfront.list_distributions = _cf_list_distributions
-    namespace["cloudfront"] = cloudfront
 
     # --- CloudWatch ---
-    cw = ServiceHelper("cw", sm.client("cloudwatch"))
+    cw = helpers["cw"]
     cw.list_alarms = _paginated_helper(
         sm, "cloudwatch", "describe_alarms", "MetricAlarms",
         columns=[("AlarmName", "Alarm"), ("StateValue", "State"),
                  ("MetricName", "Metric"), ("Namespace", "Namespace")],
         title="CloudWatch Alarms")
-    namespace["cw"] = cw
 
     # --- CloudWatch Logs ---
-    logs = ServiceHelper("logs", sm.client("logs"))
+    logs = helpers["logs"]
     logs.list_log_groups = _paginated_helper(
         sm, "logs", "describe_log_groups", "logGroups",
         columns=[("logGroupName", "Log Group"), ("storedBytes", "Stored Bytes"),
                  ("retentionInDays", "Retention")],
         title="CloudWatch Log Groups")
-    namespace["logs"] = logs
 
     # --- Secrets Manager ---
-    secrets = ServiceHelper("secrets", sm.client("secretsmanager"))
+    secrets = helpers["secrets"]
     secrets.list_secrets = _paginated_helper(
         sm, "secretsmanager", "list_secrets", "SecretList",
         columns=[("Name", "Secret"), ("Description", "Description"),
                  ("LastChangedDate", "Last Changed")],
         title="Secrets Manager")
-    namespace["secrets"] = secrets
 
     # --- DynamoDB ---
-    dynamodb = ServiceHelper("dynamodb", sm.client("dynamodb"))
+    dynamodb = helpers["dynamodb"]
 
     def _ddb_list_tables():
         return ResourceTable(
@@ -1596,19 +2083,17 @@ def _attach_service_helpers(namespace, session_manager):
         )
 
     dynamodb.list_tables = _ddb_list_tables
-    namespace["dynamodb"] = dynamodb
 
     # --- SSM ---
-    ssm_client = ServiceHelper("ssm", sm.client("ssm"))
+    ssm_client = helpers["ssm_client"]
     ssm_client.list_parameters = _paginated_helper(
         sm, "ssm", "describe_parameters", "Parameters",
         columns=[("Name", "Parameter"), ("Type", "Type"),
                  ("LastModifiedDate", "Last Modified")],
         title="SSM Parameters")
-    namespace["ssm_client"] = ssm_client
 
     # --- ECS ---
-    ecs_client = ServiceHelper("ecs", sm.client("ecs"))
+    ecs_client = helpers["ecs_client"]
 
     def _ecs_list_clusters():
         return ResourceTable(
@@ -1617,20 +2102,47 @@ def _attach_service_helpers(namespace, session_manager):
         )
 
     ecs_client.list_clusters = _ecs_list_clusters
-    namespace["ecs_client"] = ecs_client
 
     # --- SSO Admin ---
-    sso_admin = ServiceHelper("sso_admin", sm.client("sso-admin"))
+    sso_admin = helpers["sso_admin"]
 
     def _sso_get_instance_arn():
         """Get the SSO instance ARN (auto-detected)."""
         c = sm.client("sso-admin")
-        instances = c.list_instances().get("Instances", [])
+        instances = cached_call(
+            sm, ("sso-admin", "list_instances"),
+            lambda: tuple(c.list_instances().get("Instances", [])), ttl=SLOW_CACHE_TTL,
+        )
         if not instances:
             console.print("[red]No SSO instance found[/red]")
             return None
         return instances[0]["InstanceArn"]
 
+    def _sso_permission_sets(client, instance_arn):
+        """Return (arns, details) for every permission set, in listing order.
+
+        Describing takes one call per ARN, so those are issued concurrently;
+        16 workers keeps well under the Identity Center API throttling
+        limits. The result is cached for SLOW_CACHE_TTL seconds.
+        """
+        def _describe(arn):
+            return client.describe_permission_set(
+                InstanceArn=instance_arn,
+                PermissionSetArn=arn,
+            ).get("PermissionSet", {})
+
+        def fetch():
+            paginator = get_paginator(client, "list_permission_sets")
+            arns = tuple(_iter_pages(paginator.paginate(InstanceArn=instance_arn), "PermissionSets"))
+            if len(arns) < 2:
+                return arns, tuple(map(_describe, arns))
+            with ThreadPoolExecutor(max_workers=min(16, len(arns))) as pool:
+                return arns, tuple(pool.map(_describe, arns))
+
+        return cached_call(
+            sm, ("sso-admin", "permission_sets", instance_arn), fetch, ttl=SLOW_CACHE_TTL,
+        )
+
     def _sso_list_permission_sets():
         """List all permission sets with names and details."""
         c = sm.client("sso-admin")
@@ -1638,20 +2150,7 @@ def _attach_service_helpers(namespace, session_manager):
         if not instance_arn:
             return ResourceTable([])
 
-        # Get all permission set ARNs
-        arns = []
-        paginator = c.get_paginator("list_permission_sets")
-        for page in paginator.paginate(InstanceArn=instance_arn):
-            arns.extend(page.get("PermissionSets", []))
-
-        # Enrich each with describe_permission_set
-        sets = []
-        for arn in arns:
-            detail = c.describe_permission_set(
-                InstanceArn=instance_arn,
-                PermissionSetArn=arn,
-            ).get("PermissionSet", {})
-            sets.append(detail)
+        _, sets = _sso_permission_sets(c, instance_arn)
 
         return ResourceTable(sets, columns=[
             ("Name", "Name", "green"),
@@ -1667,7 +2166,6 @@ def _attach_service_helpers(namespace, session_manager):
         Returns the policy dict. Prints as JSON automatically.
         To get raw dict without printing, use: sso_admin.get_policy("name").data
         """
-        import json as _json
         c = sm.client("sso-admin")
         instance_arn = _sso_get_instance_arn()
         if not instance_arn:
@@ -1686,17 +2184,27 @@ def _attach_service_helpers(namespace, session_manager):
             console.print("[dim]No inline policy attached[/dim]")
             return {}
 
-        policy = _json.loads(policy_str)
+        policy = loads_json(policy_str)
         # Wrap statements as a ResourceTable for consistent display
         statements = policy.get("Statement", [])
-        for stmt in statements:
+        if isinstance(statements, dict):
+            # A policy with one statement may give it bare, not in a list
+            statements = [statements]
+
+        def _flat(value):
             # Flatten Action/Resource lists for display
-            actions = stmt.get("Action", [])
-            stmt["_Actions"] = ", ".join(actions) if isinstance(actions, list) else actions
-            resources = stmt.get("Resource", [])
-            stmt["_Resources"] = ", ".join(resources) if isinstance(resources, list) else resources
+            return ", ".join(value) if isinstance(value, list) else value
+
+        rows = [
+            {
+                **stmt,
+                "_Actions": _flat(stmt.get("Action", [])),
+                "_Resources": _flat(stmt.get("Resource", [])),
+            }
+            for stmt in statements
+        ]
 
-        return ResourceTable(statements, columns=[
+        return ResourceTable(rows, columns=[
             ("Sid", "Sid", "cyan"),
             ("Effect", "Effect", "bold"),
             ("_Actions", "Actions", "yellow"),
@@ -1714,10 +2222,11 @@ def _attach_service_helpers(namespace, session_manager):
         if not ps_arn:
             return ResourceTable([])
 
-        policies = []
-        paginator = c.get_paginator("list_managed_policies_in_permission_set")
-        for page in paginator.paginate(InstanceArn=instance_arn, PermissionSetArn=ps_arn):
-            policies.extend(page.get("AttachedManagedPolicies", []))
+        paginator = get_paginator(c, "list_managed_policies_in_permission_set")
+        policies = _collect_pages(
+            paginator.paginate(InstanceArn=instance_arn, PermissionSetArn=ps_arn),
+            "AttachedManagedPolicies",
+        )
 
         return ResourceTable(policies, columns=[
             ("Name", "Policy Name", "green"),
@@ -1739,14 +2248,12 @@ def _attach_service_helpers(namespace, session_manager):
             # Try to get from STS
             account_id = sm.client("sts").get_caller_identity()["Account"]
 
-        assignments = []
-        paginator = c.get_paginator("list_account_assignments")
-        for page in paginator.paginate(
+        paginator = get_paginator(c, "list_account_assignments")
+        assignments = _collect_pages(paginator.paginate(
             InstanceArn=instance_arn,
             PermissionSetArn=ps_arn,
             AccountId=account_id,
-        ):
-            assignments.extend(page.get("AccountAssignments", []))
+        ), "AccountAssignments")
 
         return ResourceTable(assignments, columns=[
             ("PrincipalType", "Principal Type", "yellow"),
@@ -1760,22 +2267,44 @@ def _attach_service_helpers(namespace, session_manager):
         if name_or_arn and name_or_arn.startswith("arn:"):
             return name_or_arn
 
-        # List all and match by name
-        arns = []
-        paginator = client.get_paginator("list_permission_sets")
-        for page in paginator.paginate(InstanceArn=instance_arn):
-            arns.extend(page.get("PermissionSets", []))
+        if name_or_arn is None:
+            console.print(f"[yellow]Please specify a permission set name or ARN[/yellow]")
+            return None
 
-        for arn in arns:
-            detail = client.describe_permission_set(
-                InstanceArn=instance_arn,
-                PermissionSetArn=arn,
-            ).get("PermissionSet", {})
-            if name_or_arn is None:
-                console.print(f"[yellow]Please specify a permission set name or ARN[/yellow]")
-                return None
-            if detail.get("Name", "").lower() == name_or_arn.lower():
-                return arn
+        wanted = name_or_arn.lower()
+        cache_key = ("sso-admin", "permission_sets", instance_arn)
+        listing = cache_peek(sm, cache_key, SLOW_CACHE_TTL)
+        if listing is not None:
+            arns, details = listing[0]
+            for arn, detail in zip(arns, details):
+                if detail.get("Name", "").lower() == wanted:
+                    return arn
+        else:
+            # Not listed yet: describe concurrently and stop at the first match
+            paginator = get_paginator(client, "list_permission_sets")
+            arns = _collect_pages(paginator.paginate(InstanceArn=instance_arn), "PermissionSets")
+            pool = ThreadPoolExecutor(max_workers=max(1, min(16, len(arns))))
+            try:
+                futures = {
+                    pool.submit(
+                        client.describe_permission_set,
+                        InstanceArn=instance_arn, PermissionSetArn=arn,
+                    ): arn
+                    for arn in arns
+                }
+                found = {}
+                for future in as_completed(futures):
+                    detail = future.result().get("PermissionSet", {})
+                    if detail.get("Name", "").lower() == wanted:
+                        return futures[future]
+                    found[futures[future]] = detail
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+            # Every set was described anyway; keep the full listing
+            cached_call(
+                sm, cache_key, lambda: (tuple(arns), tuple(found[a] for a in arns)),
+                ttl=SLOW_CACHE_TTL,
+            )
 
         console.print(f"[red]Permission set '{name_or_arn}' not found[/red]")
         return None
@@ -1784,10 +2313,9 @@ def _attach_service_helpers(namespace, session_manager):
     sso_admin.get_policy = _sso_get_policy
     sso_admin.list_managed_policies = _sso_list_managed_policies
     sso_admin.list_account_assignments = _sso_list_account_assignments
-    namespace["sso_admin"] = sso_admin
 
     # --- Cache (ElastiCache) ---
-    cache = ServiceHelper("cache", sm.client("elasticache"))
+    cache = helpers["cache"]
     cache.list_clusters = _paginated_helper(
         sm, "elasticache", "describe_cache_clusters", "CacheClusters",
         columns=[("CacheClusterId", "Cluster ID"), ("CacheNodeType", "Node Type"),
@@ -1812,37 +2340,39 @@ def _attach_service_helpers(namespace, session_manager):
         ], title="ElastiCache Serverless Caches")
 
     cache.list_serverless = _cache_list_serverless
-    namespace["cache"] = cache
 
     # --- Cognito ---
-    cognito = ServiceHelper("cognito", sm.client("cognito-idp"))
+    cognito = helpers["cognito"]
 
     def _cog_list_user_pools():
+        pools = cached_call(
+            sm, ("cognito-idp", "list_user_pools"),
+            lambda: tuple(sm.client("cognito-idp").list_user_pools(MaxResults=60).get("UserPools", [])),
+        )
         return ResourceTable(
-            sm.client("cognito-idp").list_user_pools(MaxResults=60).get("UserPools", []),
+            pools,
             columns=[("Id", "Pool ID"), ("Name", "Name"),
                      ("Status", "Status"), ("CreationDate", "Created")],
             title="Cognito User Pools",
         )
 
     cognito.list_user_pools = _cog_list_user_pools
-    namespace["cognito"] = cognito
 
     # --- KMS ---
-    kms = ServiceHelper("kms", sm.client("kms"))
+    kms = helpers["kms"]
 
     def _kms_list_keys():
         c = sm.client("kms")
         # Build alias map for display
         alias_map = {}
-        for page in c.get_paginator("list_aliases").paginate():
+        for page in get_paginator(c, "list_aliases").paginate():
             for alias in page.get("Aliases", []):
                 key_id = alias.get("TargetKeyId", "")
                 if key_id:
                     alias_map.setdefault(key_id, []).append(alias.get("AliasName", ""))
 
         keys = []
-        for page in c.get_paginator("list_keys").paginate():
+        for page in get_paginator(c, "list_keys").paginate():
             for key in page.get("Keys", []):
                 key_id = key["KeyId"]
                 try:
@@ -1870,7 +2400,7 @@ def _attach_service_helpers(namespace, session_manager):
     def _kms_list_aliases(key_id=None):
         c = sm.client("kms")
         aliases = []
-        for page in c.get_paginator("list_aliases").paginate():
+        for page in get_paginator(c, "list_aliases").paginate():
             for alias in page.get("Aliases", []):
                 if key_id and key_id not in alias.get("TargetKeyId", ""):
                     continue
@@ -1883,10 +2413,17 @@ def _attach_service_helpers(namespace, session_manager):
 
     kms.list_keys = _kms_list_keys
     kms.list_aliases = _kms_list_aliases
-    namespace["kms"] = kms
+
+    namespace.update(helpers)
+    namespace["aws_lambda"] = lam
 
 
 def _refresh_clients(namespace, session_manager):
-    """Refresh all clients and service helpers after a region/profile switch."""
+    """Refresh all clients and service helpers after a region/profile switch.
+
+    Service helpers look their client up through the session manager on
+    every use, so they follow the switch on their own; only the session
+    and the cached list results need replacing.
+    """
+    api_cache.clear()
     namespace["session"] = session_manager._session
-    _attach_service_helpers(namespace, session_manager)
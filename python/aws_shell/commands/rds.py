@@ -3,9 +3,24 @@ from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
 from ..utils.output import print_json
+from ..utils.pagination import get_paginator
 
 console = Console()
 
+INSTANCE_STATUS_STYLES = {
+    "available": "[green]available[/green]",
+    "stopped": "[red]stopped[/red]",
+    "creating": "[yellow]creating[/yellow]",
+    "deleting": "[red]deleting[/red]",
+    "modifying": "[yellow]modifying[/yellow]",
+}
+
+CLUSTER_STATUS_STYLES = {
+    "available": "[green]available[/green]",
+    "creating": "[yellow]creating[/yellow]",
+    "deleting": "[red]deleting[/red]",
+}
+
 
 def register(registry):
     registry.register("rds", handle_rds, "RDS database commands")
@@ -24,7 +39,7 @@ def handle_rds(args, config, session_manager):
 
 def list_instances(args, config, session_manager):
     client = session_manager.client("rds")
-    paginator = client.get_paginator("describe_db_instances")
+    paginator = get_paginator(client, "describe_db_instances")
 
     table = Table(title=f"RDS Instances ({config.region})")
     table.add_column("DB Instance ID", style="cyan")
@@ -35,29 +50,26 @@ def list_instances(args, config, session_manager):
     table.add_column("Multi-AZ")
 
     count = 0
-    for page in paginator.paginate():
-        for db in page["DBInstances"]:
-            status = db.get("DBInstanceStatus", "")
-            status_display = {
-                "available": "[green]available[/green]",
-                "stopped": "[red]stopped[/red]",
-                "creating": "[yellow]creating[/yellow]",
-                "deleting": "[red]deleting[/red]",
-                "modifying": "[yellow]modifying[/yellow]",
-            }.get(status, status)
-
-            endpoint = db.get("Endpoint", {})
-            endpoint_str = f"{endpoint.get('Address', '')}:{endpoint.get('Port', '')}" if endpoint else ""
-
-            table.add_row(
-                db["DBInstanceIdentifier"],
-                db.get("Engine", ""),
-                status_display,
-                db.get("DBInstanceClass", ""),
-                endpoint_str,
-                str(db.get("MultiAZ", False)),
-            )
-            count += 1
+    # Large fleets span many pages; show progress until the table is ready
+    with console.status("[bold cyan]Fetching RDS instances...[/bold cyan]") as status:
+        for page in paginator.paginate():
+            for db in page["DBInstances"]:
+                db_status = db.get("DBInstanceStatus", "")
+                status_display = INSTANCE_STATUS_STYLES.get(db_status, db_status)
+
+                endpoint = db.get("Endpoint", {})
+                endpoint_str = f"{endpoint.get('Address', '')}:{endpoint.get('Port', '')}" if endpoint else ""
+
+                table.add_row(
+                    db["DBInstanceIdentifier"],
+                    db.get("Engine", ""),
+                    status_display,
+                    db.get("DBInstanceClass", ""),
+                    endpoint_str,
+                    str(db.get("MultiAZ", False)),
+                )
+                count += 1
+            status.update(f"[bold cyan]Fetching RDS instances... {count} so far[/bold cyan]")
 
     console.print(table)
     console.print(f"[dim]{count} instance(s) found[/dim]")
@@ -83,7 +95,7 @@ def get_config(args, config, session_manager):
 
 def list_clusters(args, config, session_manager):
     client = session_manager.client("rds")
-    paginator = client.get_paginator("describe_db_clusters")
+    paginator = get_paginator(client, "describe_db_clusters")
 
     table = Table(title=f"RDS Clusters ({config.region})")
     table.add_column("Cluster ID", style="cyan")
@@ -93,23 +105,21 @@ def list_clusters(args, config, session_manager):
     table.add_column("Members")
 
     count = 0
-    for page in paginator.paginate():
-        for cluster in page["DBClusters"]:
-            status = cluster.get("Status", "")
-            status_display = {
-                "available": "[green]available[/green]",
-                "creating": "[yellow]creating[/yellow]",
-                "deleting": "[red]deleting[/red]",
-            }.get(status, status)
-
-            table.add_row(
-                cluster["DBClusterIdentifier"],
-                cluster.get("Engine", ""),
-                status_display,
-                cluster.get("Endpoint", ""),
-                str(len(cluster.get("DBClusterMembers", []))),
-            )
-            count += 1
+    with console.status("[bold cyan]Fetching RDS clusters...[/bold cyan]") as status:
+        for page in paginator.paginate():
+            for cluster in page["DBClusters"]:
+                cluster_status = cluster.get("Status", "")
+                status_display = CLUSTER_STATUS_STYLES.get(cluster_status, cluster_status)
+
+                table.add_row(
+                    cluster["DBClusterIdentifier"],
+                    cluster.get("Engine", ""),
+                    status_display,
+                    cluster.get("Endpoint", ""),
+                    str(len(cluster.get("DBClusterMembers", []))),
+                )
+                count += 1
+            status.update(f"[bold cyan]Fetching RDS clusters... {count} so far[/bold cyan]")
 
     console.print(table)
     console.print(f"[dim]{count} cluster(s) found[/dim]")
@@ -2,6 +2,7 @@
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
+from ..utils.cache import cached_call
 from ..utils.output import print_json
 
 console = Console()
@@ -22,7 +23,10 @@ def handle_route53(args, config, session_manager):
 
 def list_hosted_zones(args, config, session_manager):
     client = session_manager.client("route53")
-    response = client.list_hosted_zones()
+    zones = cached_call(
+        session_manager, ("route53", "list_hosted_zones"),
+        lambda: tuple(client.list_hosted_zones().get("HostedZones", [])),
+    )
 
     table = Table(title="Route 53 Hosted Zones")
     table.add_column("Zone ID", style="cyan")
@@ -30,7 +34,7 @@ def list_hosted_zones(args, config, session_manager):
     table.add_column("Type", style="yellow")
     table.add_column("Record Count")
 
-    for zone in response.get("HostedZones", []):
+    for zone in zones:
         zone_id = zone["Id"].split("/")[-1]
         zone_type = "Private" if zone.get("Config", {}).get("PrivateZone") else "Public"
         table.add_row(
@@ -1,8 +1,12 @@
 """S3 commands."""
+from concurrent.futures import ThreadPoolExecutor
+
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
-from ..utils.output import print_json
+from ..utils.cache import cached_call
+from ..utils.output import format_timestamp, print_json
+from ..utils.pagination import get_paginator, prefetch_pages
 
 console = Console()
 
@@ -21,68 +25,103 @@ def handle_s3(args, config, session_manager):
     subcommand_dispatch("s3", subcommands, args, config, session_manager)
 
 
+def _list_buckets(session_manager):
+    # Same key as the REPL's s3 helpers, so the two share one listing
+    return cached_call(
+        session_manager, ("s3", "list_buckets"),
+        lambda: tuple(session_manager.client("s3").list_buckets().get("Buckets", [])),
+    )
+
+
 def list_buckets(args, config, session_manager):
-    s3 = session_manager.client("s3")
-    response = s3.list_buckets()
+    buckets = _list_buckets(session_manager)
 
     table = Table(title="S3 Buckets")
     table.add_column("Bucket Name", style="cyan")
     table.add_column("Creation Date", style="green")
 
-    for bucket in response.get("Buckets", []):
+    for bucket in buckets:
         table.add_row(
             bucket["Name"],
-            str(bucket.get("CreationDate", "")),
+            format_timestamp(bucket.get("CreationDate", "")),
         )
 
     console.print(table)
-    console.print(f"[dim]{len(response.get('Buckets', []))} bucket(s) found[/dim]")
+    console.print(f"[dim]{len(buckets)} bucket(s) found[/dim]")
 
 
 def list_bucket_names(args, config, session_manager):
-    s3 = session_manager.client("s3")
-    response = s3.list_buckets()
+    buckets = _list_buckets(session_manager)
 
     table = Table(title="S3 Bucket Names")
     table.add_column("Bucket Name", style="cyan")
     table.add_column("ARN", style="dim")
 
-    for bucket in response.get("Buckets", []):
+    for bucket in buckets:
         name = bucket["Name"]
         arn = bucket.get("BucketArn", f"arn:aws:s3:::{name}")
         table.add_row(name, arn)
 
     console.print(table)
-    console.print(f"[dim]{len(response.get('Buckets', []))} bucket(s)[/dim]")
+    console.print(f"[dim]{len(buckets)} bucket(s)[/dim]")
 
 
-def get_config(args, config, session_manager):
-    if not args:
-        console.print("[yellow]Usage:[/yellow] s3 get-config <bucket-name>")
-        return
-    s3 = session_manager.client("s3")
-    result = {}
+def _bucket_location(s3, bucket):
     try:
-        loc = s3.get_bucket_location(Bucket=args[0])
-        result["Location"] = loc.get("LocationConstraint", "us-east-1")
+        loc = s3.get_bucket_location(Bucket=bucket)
+        return {"Location": loc.get("LocationConstraint", "us-east-1")}
     except Exception as e:
-        result["Location"] = f"Error: {e}"
+        return {"Location": f"Error: {e}"}
+
+
+def _bucket_versioning(s3, bucket):
     try:
-        ver = s3.get_bucket_versioning(Bucket=args[0])
-        result["Versioning"] = ver.get("Status", "Disabled")
-        result["MFADelete"] = ver.get("MFADelete", "Disabled")
+        ver = s3.get_bucket_versioning(Bucket=bucket)
+        return {
+            "Versioning": ver.get("Status", "Disabled"),
+            "MFADelete": ver.get("MFADelete", "Disabled"),
+        }
     except Exception as e:
-        result["Versioning"] = f"Error: {e}"
+        return {"Versioning": f"Error: {e}"}
+
+
+def _bucket_encryption(s3, bucket):
     try:
-        enc = s3.get_bucket_encryption(Bucket=args[0])
-        result["Encryption"] = enc.get("ServerSideEncryptionConfiguration", {})
+        enc = s3.get_bucket_encryption(Bucket=bucket)
+        return {"Encryption": enc.get("ServerSideEncryptionConfiguration", {})}
     except s3.exceptions.ClientError:
-        result["Encryption"] = "None"
+        return {"Encryption": "None"}
     except Exception as e:
-        result["Encryption"] = f"Error: {e}"
+        return {"Encryption": f"Error: {e}"}
+
+
+_BUCKET_CONFIG_FETCHERS = (_bucket_location, _bucket_versioning, _bucket_encryption)
+
+
+def get_config(args, config, session_manager):
+    if not args:
+        console.print("[yellow]Usage:[/yellow] s3 get-config <bucket-name>")
+        return
+    s3 = session_manager.client("s3")
+    # The lookups are independent round-trips; run them side by side
+    with ThreadPoolExecutor(max_workers=len(_BUCKET_CONFIG_FETCHERS)) as pool:
+        futures = [pool.submit(fetch, s3, args[0]) for fetch in _BUCKET_CONFIG_FETCHERS]
+    result = {}
+    for future in futures:
+        result.update(future.result())
     print_json(result)
 
 
+def _format_size(size):
+    if size >= 1_073_741_824:
+        return f"{size / 1_073_741_824:.1f} GB"
+    if size >= 1_048_576:
+        return f"{size / 1_048_576:.1f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
 def list_objects(args, config, session_manager):
     if not args:
         console.print("[yellow]Usage:[/yellow] s3 list-objects <bucket-name> [prefix]")
@@ -92,7 +131,7 @@ def list_objects(args, config, session_manager):
     prefix = args[1] if len(args) > 1 else ""
 
     s3 = session_manager.client("s3")
-    paginator = s3.get_paginator("list_objects_v2")
+    paginator = get_paginator(s3, "list_objects_v2")
 
     table = Table(title=f"Objects in s3://{bucket}/{prefix}")
     table.add_column("Key", style="cyan")
@@ -101,25 +140,17 @@ def list_objects(args, config, session_manager):
     table.add_column("Storage Class")
 
     count = 0
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-        for obj in page.get("Contents", []):
-            size = obj.get("Size", 0)
-            if size >= 1_073_741_824:
-                size_str = f"{size / 1_073_741_824:.1f} GB"
-            elif size >= 1_048_576:
-                size_str = f"{size / 1_048_576:.1f} MB"
-            elif size >= 1024:
-                size_str = f"{size / 1024:.1f} KB"
-            else:
-                size_str = f"{size} B"
-
-            table.add_row(
-                obj["Key"],
-                size_str,
-                str(obj.get("LastModified", "")),
-                obj.get("StorageClass", ""),
-            )
-            count += 1
+    with console.status("[bold cyan]Fetching objects...[/bold cyan]") as status:
+        for page in prefetch_pages(paginator.paginate(Bucket=bucket, Prefix=prefix)):
+            for obj in page.get("Contents", []):
+                table.add_row(
+                    obj["Key"],
+                    _format_size(obj.get("Size", 0)),
+                    format_timestamp(obj.get("LastModified", "")),
+                    obj.get("StorageClass", ""),
+                )
+                count += 1
+            status.update(f"[bold cyan]Fetching objects... {count} so far[/bold cyan]")
 
     console.print(table)
     console.print(f"[dim]{count} object(s) found[/dim]")
@@ -1,38 +1,90 @@
 """Search command — fuzzy search through AWS resource configurations."""
 from rich.console import Console
 from rich.table import Table
-from ..utils.search import fuzzy_search
+from ..utils.cache import cached_call, strip_no_cache
+from ..utils.search import flatten_json, search_flat
 from ..utils.output import print_json
 
 console = Console()
 
-# Map service names to describe functions
+
+def _param(name):
+    """Call builder passing the resource ID as a single keyword argument."""
+    return lambda resource_id: {name: resource_id}
+
+
+def _param_list(name):
+    """Call builder passing the resource ID as a one-element list."""
+    return lambda resource_id: {name: [resource_id]}
+
+
+# Map service names to (client, method, call builder, result key)
 SERVICE_DESCRIBERS = {
-    "ec2": ("ec2", "describe_instances", "InstanceIds", "Reservations"),
-    "rds": ("rds", "describe_db_instances", "DBInstanceIdentifier", None),
-    "s3": ("s3", "list_objects_v2", "Bucket", None),
-    "lambda": ("lambda", "get_function", "FunctionName", None),
-    "ecs": ("ecs", "describe_clusters", "clusters", None),
-    "cloudfront": ("cloudfront", "get_distribution", "Id", None),
-    "dynamodb": ("dynamodb", "describe_table", "TableName", "Table"),
-    "opensearch": ("opensearch", "describe_domain", "DomainName", "DomainStatus"),
-    "secrets": ("secretsmanager", "describe_secret", "SecretId", None),
-    "ssm": ("ssm", "get_parameter", "Name", "Parameter"),
-    "cache": ("elasticache", "describe_serverless_caches", "ServerlessCacheName", None),
-    "cognito": ("cognito-idp", "describe_user_pool", "UserPoolId", "UserPool"),
-    "route53": ("route53", "get_hosted_zone", "Id", None),
-    "sqs": ("sqs", "get_queue_attributes", "QueueUrl", "Attributes"),
+    "ec2": ("ec2", "describe_instances", _param_list("InstanceIds"), "Reservations"),
+    "rds": ("rds", "describe_db_instances", _param("DBInstanceIdentifier"), None),
+    "s3": ("s3", "list_objects_v2", _param("Bucket"), None),
+    "lambda": ("lambda", "get_function", _param("FunctionName"), None),
+    "ecs": ("ecs", "describe_clusters", _param_list("clusters"), None),
+    "cloudfront": ("cloudfront", "get_distribution", _param("Id"), None),
+    "dynamodb": ("dynamodb", "describe_table", _param("TableName"), "Table"),
+    "opensearch": ("opensearch", "describe_domain", _param("DomainName"), "DomainStatus"),
+    "secrets": ("secretsmanager", "describe_secret", _param("SecretId"), None),
+    "ssm": ("ssm", "get_parameter", _param("Name"), "Parameter"),
+    "cache": ("elasticache", "describe_serverless_caches", _param("ServerlessCacheName"), None),
+    "cognito": ("cognito-idp", "describe_user_pool", _param("UserPoolId"), "UserPool"),
+    "route53": ("route53", "get_hosted_zone", _param("Id"), None),
+    "sqs": (
+        "sqs", "get_queue_attributes",
+        lambda resource_id: {"QueueUrl": resource_id, "AttributeNames": ["All"]},
+        "Attributes",
+    ),
+}
+
+_SERVICE_NAMES = ", ".join(sorted(SERVICE_DESCRIBERS))
+
+# Second (method, call builder) to try when the first describe fails
+SERVICE_FALLBACKS = {
+    # Not a serverless cache — try a traditional cluster
+    "cache": (
+        "describe_cache_clusters",
+        lambda resource_id: {"CacheClusterId": resource_id, "ShowCacheNodeInfo": True},
+    ),
 }
 
 
+def _describe_flat(session_manager, service, resource_id):
+    """Describe a resource and return its response flattened to (path, value) pairs."""
+    client_name, method_name, build_kwargs, result_key = SERVICE_DESCRIBERS[service]
+    client = session_manager.client(client_name)
+    try:
+        response = getattr(client, method_name)(**build_kwargs(resource_id))
+    except Exception:
+        if service not in SERVICE_FALLBACKS:
+            raise
+        method_name, build_kwargs = SERVICE_FALLBACKS[service]
+        response = getattr(client, method_name)(**build_kwargs(resource_id))
+
+    # Extract the relevant data
+    data = response
+    if result_key and result_key in data:
+        data = data[result_key]
+
+    # Remove metadata
+    if isinstance(data, dict):
+        data.pop("ResponseMetadata", None)
+
+    return tuple(flatten_json(data))
+
+
 def register(registry):
     registry.register("search", cmd_search, "Fuzzy search through resource config")
 
 
 def cmd_search(args, config, session_manager):
+    args = strip_no_cache(args)
     if len(args) < 3:
         console.print(
-            "[yellow]Usage:[/yellow] search <service> <resource-id> <keyword>\n"
+            "[yellow]Usage:[/yellow] search <service> <resource-id> <keyword> [--no-cache]\n"
             "[dim]Example: search ec2 i-abc123 subnet[/dim]\n"
             "[dim]Example: search rds mydb encryption[/dim]"
         )
@@ -45,44 +97,18 @@ def cmd_search(args, config, session_manager):
     if service not in SERVICE_DESCRIBERS:
         console.print(
             f"[red]Unsupported service:[/red] {service}\n"
-            f"Available: {', '.join(sorted(SERVICE_DESCRIBERS.keys()))}"
+            f"Available: {_SERVICE_NAMES}"
         )
         return
 
-    client_name, method_name, param_name, result_key = SERVICE_DESCRIBERS[service]
-
     try:
-        client = session_manager.client(client_name)
-        method = getattr(client, method_name)
-
-        # Build the API call arguments
-        if service == "ec2":
-            response = method(**{param_name: [resource_id]})
-        elif service == "ecs":
-            response = method(**{param_name: [resource_id]})
-        elif service == "sqs":
-            response = method(QueueUrl=resource_id, AttributeNames=["All"])
-        elif service == "rds":
-            response = method(DBInstanceIdentifier=resource_id)
-        elif service == "cache":
-            # Try serverless first, fall back to traditional cluster
-            try:
-                response = client.describe_serverless_caches(ServerlessCacheName=resource_id)
-            except Exception:
-                response = client.describe_cache_clusters(CacheClusterId=resource_id, ShowCacheNodeInfo=True)
-        else:
-            response = method(**{param_name: resource_id})
-
-        # Extract the relevant data
-        data = response
-        if result_key and result_key in data:
-            data = data[result_key]
-
-        # Remove metadata
-        if isinstance(data, dict):
-            data.pop("ResponseMetadata", None)
-
-        results = fuzzy_search(data, keyword)
+        # Refining the keyword on the same resource reuses the flattened
+        # response instead of describing and walking it again
+        flat = cached_call(
+            session_manager, ("search", service, resource_id),
+            lambda: _describe_flat(session_manager, service, resource_id),
+        )
+        results = search_flat(flat, keyword, max_value_len=120)
 
         if not results:
             console.print(f"[dim]No matches for '{keyword}' in {service} {resource_id}[/dim]")
@@ -93,9 +119,7 @@ def cmd_search(args, config, session_manager):
         table.add_column("Value", style="green")
 
         for path, value in results:
-            # Truncate long values for display
-            display_value = value if len(value) <= 120 else value[:117] + "..."
-            table.add_row(path, display_value)
+            table.add_row(path, value)
 
         console.print(table)
         console.print(f"[dim]{len(results)} match(es) found[/dim]")
@@ -2,7 +2,8 @@
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
-from ..utils.output import print_json
+from ..utils.output import format_timestamp, print_json
+from ..utils.pagination import get_paginator, prefetch_pages
 
 console = Console()
 
@@ -22,7 +23,7 @@ def handle_secrets(args, config, session_manager):
 
 def list_secrets(args, config, session_manager):
     client = session_manager.client("secretsmanager")
-    paginator = client.get_paginator("list_secrets")
+    paginator = get_paginator(client, "list_secrets")
 
     table = Table(title=f"Secrets ({config.region})")
     table.add_column("Name", style="cyan")
@@ -32,16 +33,18 @@ def list_secrets(args, config, session_manager):
     table.add_column("Rotation", style="yellow")
 
     count = 0
-    for page in paginator.paginate():
-        for secret in page.get("SecretList", []):
-            table.add_row(
-                secret.get("Name", ""),
-                secret.get("Description", ""),
-                str(secret.get("LastChangedDate", "")),
-                str(secret.get("LastAccessedDate", "")),
-                str(secret.get("RotationEnabled", False)),
-            )
-            count += 1
+    with console.status("[bold cyan]Fetching secrets...[/bold cyan]") as status:
+        for page in prefetch_pages(paginator.paginate(PaginationConfig={"PageSize": 100})):
+            for secret in page.get("SecretList", []):
+                table.add_row(
+                    secret.get("Name", ""),
+                    secret.get("Description", ""),
+                    format_timestamp(secret.get("LastChangedDate", "")),
+                    format_timestamp(secret.get("LastAccessedDate", "")),
+                    str(secret.get("RotationEnabled", False)),
+                )
+                count += 1
+            status.update(f"[bold cyan]Fetching secrets... {count} so far[/bold cyan]")
 
     console.print(table)
     console.print(f"[dim]{count} secret(s) found[/dim]")
@@ -2,6 +2,7 @@
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
+from ..utils.cache import cached_call
 from ..utils.output import print_json
 
 console = Console()
@@ -23,14 +24,17 @@ def handle_ses(args, config, session_manager):
 
 def list_identities(args, config, session_manager):
     client = session_manager.client("sesv2")
-    response = client.list_email_identities()
+    identities = cached_call(
+        session_manager, ("sesv2", "list_email_identities"),
+        lambda: tuple(client.list_email_identities().get("EmailIdentities", [])),
+    )
 
     table = Table(title=f"SES Email Identities ({config.region})")
     table.add_column("Identity", style="cyan")
     table.add_column("Type", style="green")
     table.add_column("Sending Enabled", style="yellow")
 
-    for identity in response.get("EmailIdentities", []):
+    for identity in identities:
         table.add_row(
             identity.get("IdentityName", ""),
             identity.get("IdentityType", ""),
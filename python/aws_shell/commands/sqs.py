@@ -2,10 +2,16 @@
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
+from ..utils.cache import cached_call
 from ..utils.output import print_json
 
 console = Console()
 
+# Attributes include the ApproximateNumberOfMessages* counters, which users
+# re-run these commands to watch; keep them only long enough to serve
+# back-to-back describe/get-config calls
+_ATTRIBUTES_TTL = 5
+
 
 def register(registry):
     registry.register("sqs", handle_sqs, "SQS queue commands")
@@ -23,50 +29,51 @@ def handle_sqs(args, config, session_manager):
 
 def list_queues(args, config, session_manager):
     client = session_manager.client("sqs")
-    response = client.list_queues()
+    urls = cached_call(
+        session_manager, ("sqs", "list_queues"),
+        lambda: tuple(client.list_queues().get("QueueUrls", [])),
+    )
 
     table = Table(title=f"SQS Queues ({config.region})")
     table.add_column("Queue URL", style="cyan")
 
-    for url in response.get("QueueUrls", []):
+    for url in urls:
         table.add_row(url)
 
-    count = len(response.get("QueueUrls", []))
+    count = len(urls)
     console.print(table)
     console.print(f"[dim]{count} queue(s) found[/dim]")
 
 
+def _queue_attributes(session_manager, queue_url):
+    """Return all attributes of a queue (shared by the three attribute commands)."""
+    client = session_manager.client("sqs")
+    return cached_call(
+        session_manager, ("sqs", "get_queue_attributes", queue_url),
+        lambda: client.get_queue_attributes(
+            QueueUrl=queue_url,
+            AttributeNames=["All"],
+        ).get("Attributes", {}),
+        ttl=_ATTRIBUTES_TTL,
+    )
+
+
 def get_config(args, config, session_manager):
     if not args:
         console.print("[yellow]Usage:[/yellow] sqs get-config <queue-url>")
         return
-    client = session_manager.client("sqs")
-    response = client.get_queue_attributes(
-        QueueUrl=args[0],
-        AttributeNames=["All"],
-    )
-    print_json(response.get("Attributes", {}))
+    print_json(_queue_attributes(session_manager, args[0]))
 
 
 def describe_queue(args, config, session_manager):
     if not args:
         console.print("[yellow]Usage:[/yellow] sqs describe-queue <queue-url>")
         return
-    client = session_manager.client("sqs")
-    response = client.get_queue_attributes(
-        QueueUrl=args[0],
-        AttributeNames=["All"],
-    )
-    print_json(response.get("Attributes", {}))
+    print_json(_queue_attributes(session_manager, args[0]))
 
 
 def get_queue_attributes(args, config, session_manager):
     if not args:
         console.print("[yellow]Usage:[/yellow] sqs get-queue-attributes <queue-url>")
         return
-    client = session_manager.client("sqs")
-    response = client.get_queue_attributes(
-        QueueUrl=args[0],
-        AttributeNames=["All"],
-    )
-    print_json(response.get("Attributes", {}))
+    print_json(_queue_attributes(session_manager, args[0]))
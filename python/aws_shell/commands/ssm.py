@@ -2,10 +2,18 @@
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
-from ..utils.output import print_json
+from ..utils.cache import cached_call
+from ..utils.output import format_timestamp, print_json
+from ..utils.pagination import get_paginator, prefetch_pages
 
 console = Console()
 
+PING_STATUS_STYLES = {
+    "Online": "[green]Online[/green]",
+    "ConnectionLost": "[red]ConnectionLost[/red]",
+    "Inactive": "[yellow]Inactive[/yellow]",
+}
+
 
 def register(registry):
     registry.register("ssm", handle_ssm, "Systems Manager commands")
@@ -23,7 +31,14 @@ def handle_ssm(args, config, session_manager):
 
 def list_parameters(args, config, session_manager):
     client = session_manager.client("ssm")
-    paginator = client.get_paginator("describe_parameters")
+    paginator = get_paginator(client, "describe_parameters")
+
+    # 50 is the API maximum; the default of 10 means five times the round-trips
+    kwargs = {"PaginationConfig": {"PageSize": 50}}
+    if args:
+        kwargs["ParameterFilters"] = [
+            {"Key": "Name", "Option": "BeginsWith", "Values": [args[0]]}
+        ]
 
     table = Table(title=f"SSM Parameters ({config.region})")
     table.add_column("Name", style="cyan")
@@ -33,16 +48,19 @@ def list_parameters(args, config, session_manager):
     table.add_column("Version")
 
     count = 0
-    for page in paginator.paginate():
-        for param in page.get("Parameters", []):
-            table.add_row(
-                param.get("Name", ""),
-                param.get("Type", ""),
-                param.get("Tier", ""),
-                str(param.get("LastModifiedDate", "")),
-                str(param.get("Version", "")),
-            )
-            count += 1
+    # Large listings span many pages; show progress until the table is ready
+    with console.status("[bold cyan]Fetching SSM parameters...[/bold cyan]") as status:
+        for page in prefetch_pages(paginator.paginate(**kwargs)):
+            for param in page.get("Parameters", []):
+                table.add_row(
+                    param.get("Name", ""),
+                    param.get("Type", ""),
+                    param.get("Tier", ""),
+                    format_timestamp(param.get("LastModifiedDate", "")),
+                    str(param.get("Version", "")),
+                )
+                count += 1
+            status.update(f"[bold cyan]Fetching SSM parameters... {count} so far[/bold cyan]")
 
     console.print(table)
     console.print(f"[dim]{count} parameter(s) found[/dim]")
@@ -68,7 +86,10 @@ def get_config(args, config, session_manager):
 
 def list_instances(args, config, session_manager):
     client = session_manager.client("ssm")
-    response = client.describe_instance_information()
+    instances = cached_call(
+        session_manager, ("ssm", "describe_instance_information"),
+        lambda: tuple(client.describe_instance_information().get("InstanceInformationList", [])),
+    )
 
     table = Table(title=f"SSM Managed Instances ({config.region})")
     table.add_column("Instance ID", style="cyan")
@@ -77,13 +98,9 @@ def list_instances(args, config, session_manager):
     table.add_column("Platform Version")
     table.add_column("Agent Version", style="yellow")
 
-    for instance in response.get("InstanceInformationList", []):
+    for instance in instances:
         ping = instance.get("PingStatus", "")
-        ping_display = {
-            "Online": "[green]Online[/green]",
-            "ConnectionLost": "[red]ConnectionLost[/red]",
-            "Inactive": "[yellow]Inactive[/yellow]",
-        }.get(ping, ping)
+        ping_display = PING_STATUS_STYLES.get(ping, ping)
 
         table.add_row(
             instance.get("InstanceId", ""),
@@ -1,11 +1,16 @@
 """SSO Admin commands."""
+from concurrent.futures import ThreadPoolExecutor
+
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
+from ..utils.cache import SLOW_CACHE_TTL, cached_call
 from ..utils.output import print_json
 
 console = Console()
 
+_DESCRIBE_WORKERS = 16
+
 
 def register(registry):
     registry.register("sso", handle_sso, "SSO Admin commands")
@@ -22,13 +27,18 @@ def handle_sso(args, config, session_manager):
 
 def list_instances(args, config, session_manager):
     client = session_manager.client("sso-admin")
-    response = client.list_instances()
+    # Same key and lifetime as the REPL's sso helpers; stored as a tuple so
+    # neither caller can change the shared entry
+    instances = cached_call(
+        session_manager, ("sso-admin", "list_instances"),
+        lambda: tuple(client.list_instances().get("Instances", [])), ttl=SLOW_CACHE_TTL,
+    )
 
     table = Table(title="SSO Instances")
     table.add_column("Instance ARN", style="cyan")
     table.add_column("Identity Store ID", style="green")
 
-    for instance in response.get("Instances", []):
+    for instance in instances:
         table.add_row(
             instance.get("InstanceArn", ""),
             instance.get("IdentityStoreId", ""),
@@ -36,6 +46,23 @@ def list_instances(args, config, session_manager):
     console.print(table)
 
 
+def _describe_permission_sets(client, instance_arn, arns):
+    """Describe each permission set concurrently, keeping the order of ``arns``."""
+    def describe(arn):
+        try:
+            detail = client.describe_permission_set(
+                InstanceArn=instance_arn, PermissionSetArn=arn
+            )
+            return detail.get("PermissionSet", {})
+        except Exception:
+            return {"PermissionSetArn": arn, "Error": "Could not describe"}
+
+    if not arns:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_DESCRIBE_WORKERS, len(arns))) as pool:
+        return list(pool.map(describe, arns))
+
+
 def get_config(args, config, session_manager):
     if not args:
         console.print("[yellow]Usage:[/yellow] sso get-config <instance-arn>")
@@ -43,16 +70,7 @@ def get_config(args, config, session_manager):
     client = session_manager.client("sso-admin")
     response = client.list_permission_sets(InstanceArn=args[0])
     arns = response.get("PermissionSets", [])
-    results = []
-    for arn in arns:
-        try:
-            detail = client.describe_permission_set(
-                InstanceArn=args[0], PermissionSetArn=arn
-            )
-            results.append(detail.get("PermissionSet", {}))
-        except Exception:
-            results.append({"PermissionSetArn": arn, "Error": "Could not describe"})
-    print_json(results)
+    print_json(_describe_permission_sets(client, args[0], arns))
 
 
 def list_permission_sets(args, config, session_manager):
@@ -73,19 +91,15 @@ def list_permission_sets(args, config, session_manager):
     table.add_column("Description")
     table.add_column("Session Duration")
 
-    for arn in arns:
-        try:
-            detail = client.describe_permission_set(
-                InstanceArn=args[0], PermissionSetArn=arn
-            )
-            ps = detail.get("PermissionSet", {})
-            table.add_row(
-                arn,
-                ps.get("Name", ""),
-                ps.get("Description", ""),
-                ps.get("SessionDuration", ""),
-            )
-        except Exception:
+    for arn, ps in zip(arns, _describe_permission_sets(client, args[0], arns)):
+        if "Error" in ps:
             table.add_row(arn, "", "", "")
+            continue
+        table.add_row(
+            arn,
+            ps.get("Name", ""),
+            ps.get("Description", ""),
+            ps.get("SessionDuration", ""),
+        )
 
     console.print(table)
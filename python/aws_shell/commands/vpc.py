@@ -2,7 +2,8 @@
 from rich.console import Console
 from rich.table import Table
 from .base import subcommand_dispatch
-from ..utils.output import print_json
+from ..utils.cache import cached_call
+from ..utils.output import print_json, tag_value
 
 console = Console()
 
@@ -24,7 +25,10 @@ def handle_vpc(args, config, session_manager):
 
 def list_vpcs(args, config, session_manager):
     ec2 = session_manager.client("ec2")
-    response = ec2.describe_vpcs()
+    vpcs = cached_call(
+        session_manager, ("ec2", "describe_vpcs"),
+        lambda: tuple(ec2.describe_vpcs()["Vpcs"]),
+    )
 
     table = Table(title=f"VPCs ({config.region})")
     table.add_column("VPC ID", style="cyan")
@@ -33,11 +37,8 @@ def list_vpcs(args, config, session_manager):
     table.add_column("Default")
     table.add_column("Name")
 
-    for vpc in response["Vpcs"]:
-        name = ""
-        for tag in vpc.get("Tags", []):
-            if tag["Key"] == "Name":
-                name = tag["Value"]
+    for vpc in vpcs:
+        name = tag_value(vpc.get("Tags", ()), "Name")
         table.add_row(
             vpc["VpcId"],
             vpc["CidrBlock"],
@@ -46,7 +47,7 @@ def list_vpcs(args, config, session_manager):
             name,
         )
     console.print(table)
-    console.print(f"[dim]{len(response['Vpcs'])} VPC(s) found[/dim]")
+    console.print(f"[dim]{len(vpcs)} VPC(s) found[/dim]")
 
 
 def describe_vpc(args, config, session_manager):
@@ -66,6 +67,7 @@ def list_subnets(args, config, session_manager):
         filters.append({"Name": "vpc-id", "Values": [args[0]]})
 
     response = ec2.describe_subnets(Filters=filters) if filters else ec2.describe_subnets()
+    subnets = response["Subnets"]
 
     table = Table(title=f"Subnets ({config.region})")
     table.add_column("Subnet ID", style="cyan")
@@ -75,11 +77,8 @@ def list_subnets(args, config, session_manager):
     table.add_column("Available IPs", justify="right")
     table.add_column("Name")
 
-    for subnet in response["Subnets"]:
-        name = ""
-        for tag in subnet.get("Tags", []):
-            if tag["Key"] == "Name":
-                name = tag["Value"]
+    for subnet in subnets:
+        name = tag_value(subnet.get("Tags", ()), "Name")
         table.add_row(
             subnet["SubnetId"],
             subnet["VpcId"],
@@ -89,7 +88,7 @@ def list_subnets(args, config, session_manager):
             name,
         )
     console.print(table)
-    console.print(f"[dim]{len(response['Subnets'])} subnet(s) found[/dim]")
+    console.print(f"[dim]{len(subnets)} subnet(s) found[/dim]")
 
 
 def list_security_groups(args, config, session_manager):
@@ -100,6 +99,7 @@ def list_security_groups(args, config, session_manager):
         filters.append({"Name": "vpc-id", "Values": [args[0]]})
 
     response = ec2.describe_security_groups(Filters=filters) if filters else ec2.describe_security_groups()
+    groups = response["SecurityGroups"]
 
     table = Table(title=f"Security Groups ({config.region})")
     table.add_column("Group ID", style="cyan")
@@ -107,7 +107,7 @@ def list_security_groups(args, config, session_manager):
     table.add_column("VPC ID")
     table.add_column("Description")
 
-    for sg in response["SecurityGroups"]:
+    for sg in groups:
         table.add_row(
             sg["GroupId"],
             sg["GroupName"],
@@ -115,7 +115,7 @@ def list_security_groups(args, config, session_manager):
             sg.get("Description", ""),
         )
     console.print(table)
-    console.print(f"[dim]{len(response['SecurityGroups'])} security group(s) found[/dim]")
+    console.print(f"[dim]{len(groups)} security group(s) found[/dim]")
 
 
 def get_config(args, config, session_manager):
@@ -1,4 +1,6 @@
 """Auto-completion for AWS Shell with descriptions."""
+import functools
+
 from prompt_toolkit.completion import Completer, Completion
 
 AWS_REGIONS = [
@@ -237,6 +239,22 @@ SUBCOMMAND_DESCRIPTIONS = {
 }
 
 
+@functools.lru_cache(maxsize=512)
+def _prefix_completions(command, partial):
+    """Completions for names starting with partial, with their descriptions.
+
+    command is None for top-level commands, otherwise the command whose
+    subcommands are completed. The tables are static, so the result for a
+    prefix is built once and reused on every later keystroke that repeats it.
+    """
+    names = COMMAND_DESCRIPTIONS if command is None else SUBCOMMAND_DESCRIPTIONS[command]
+    return tuple(
+        Completion(name, start_position=-len(partial), display_meta=desc)
+        for name, desc in names.items()
+        if name.startswith(partial)
+    )
+
+
 class AWSShellCompleter(Completer):
     """Custom completer that provides descriptions alongside completions."""
 
@@ -247,13 +265,7 @@ class AWSShellCompleter(Completer):
         if not parts or (len(parts) == 1 and not text.endswith(" ")):
             # Completing the first word (top-level command)
             partial = parts[0].lower() if parts else ""
-            for cmd, desc in COMMAND_DESCRIPTIONS.items():
-                if cmd.startswith(partial):
-                    yield Completion(
-                        cmd,
-                        start_position=-len(partial),
-                        display_meta=desc,
-                    )
+            yield from _prefix_completions(None, partial)
         elif len(parts) >= 1:
             command = parts[0].lower()
 
@@ -286,7 +298,6 @@ class AWSShellCompleter(Completer):
 
             # Subcommand completion
             if command in SUBCOMMAND_DESCRIPTIONS:
-                subcmds = SUBCOMMAND_DESCRIPTIONS[command]
                 # Only complete the second word
                 if len(parts) == 1 and text.endswith(" "):
                     partial = ""
@@ -295,13 +306,7 @@ class AWSShellCompleter(Completer):
                 else:
                     return
 
-                for sub, desc in subcmds.items():
-                    if sub.startswith(partial):
-                        yield Completion(
-                            sub,
-                            start_position=-len(partial),
-                            display_meta=desc,
-                        )
+                yield from _prefix_completions(command, partial)
 
 
 def build_completer(registry, session_manager):
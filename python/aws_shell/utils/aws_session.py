@@ -1,44 +1,88 @@
 """boto3 session management."""
+import functools
+
 import boto3
+from botocore.config import Config
 from rich.console import Console
 
 console = Console()
 
+# Room for concurrent helper calls (e.g. the REPL's list_all()) to share a
+# client without queueing on botocore's default pool of 10 connections.
+# Those fan-outs can trip API rate limits, so retry throttled calls with
+# adaptive client-side rate limiting instead of failing the listing.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _make_session(profile, region):
+    """Build (once) the boto3 session for a profile/region pair.
+
+    Raises if the profile can't be loaded; lru_cache doesn't store
+    exceptions, so the next switch to that profile tries again.
+    """
+    return boto3.Session(profile_name=profile, region_name=region)
+
+
+@functools.lru_cache(maxsize=128)
+def _make_client(profile, region, service_name):
+    """Build (once) a boto3 client for a profile/region/service triple.
+
+    Clients are reused while the profile and region stay the same; an
+    explicit switch clears this cache and _make_session's (see
+    AWSSessionManager._clear_caches).
+    """
+    return _make_session(profile, region).client(
+        service_name, region_name=region, config=_CLIENT_CONFIG
+    )
+
 
 class AWSSessionManager:
     def __init__(self, config):
         self.config = config
         self._session = None
-        self._clients = {}
+        self._fallback = False
         self._account_id_cache = None
         self._rebuild_session()
 
     def _rebuild_session(self):
-        self._clients.clear()
         self._account_id_cache = None
         try:
-            self._session = boto3.Session(
-                profile_name=self.config.profile,
-                region_name=self.config.region,
-            )
+            self._session = _make_session(self.config.profile, self.config.region)
+            self._fallback = False
         except Exception as e:
             console.print(f"[bold red]Session error:[/bold red] {e}")
+            # Default credentials, kept out of the caches so fixing the
+            # profile takes effect on the next switch
             self._session = boto3.Session(region_name=self.config.region)
+            self._fallback = True
 
     def client(self, service_name):
-        key = f"{service_name}:{self.config.region}:{self.config.profile}"
-        if key not in self._clients:
-            self._clients[key] = self._session.client(
-                service_name, region_name=self.config.region
+        if self._fallback:
+            return self._session.client(
+                service_name, region_name=self.config.region, config=_CLIENT_CONFIG
             )
-        return self._clients[key]
+        return _make_client(self.config.profile, self.config.region, service_name)
+
+    @staticmethod
+    def _clear_caches():
+        # A session keeps the credentials it resolved first, so switching
+        # (even back to the same profile) must build new ones to pick up
+        # rotated keys or a fresh SSO login
+        _make_client.cache_clear()
+        _make_session.cache_clear()
 
     def switch_profile(self, profile):
         self.config.set_profile(profile)
+        self._clear_caches()
         self._rebuild_session()
 
     def switch_region(self, region):
         self.config.set_region(region)
+        self._clear_caches()
         self._rebuild_session()
 
     def get_caller_identity(self):
@@ -0,0 +1,76 @@
+"""Short-lived cache for AWS list responses."""
+import os
+import time
+
+# Results keyed by (profile, region, service, method, ...), stored as
+# (time stored, value, ttl).
+# Listings are often re-run within seconds (or re-filtered in the REPL), so
+# keep them for a short while instead of calling the API again every time.
+# AWS_SHELL_CACHE_TTL overrides the lifetime in seconds; 0 disables it.
+try:
+    API_CACHE_TTL = float(os.environ.get("AWS_SHELL_CACHE_TTL", 30))
+except ValueError:
+    API_CACHE_TTL = 30
+api_cache = {}
+
+# Lookups that hardly change within a session (e.g. the SSO instance and its
+# permission sets) share api_cache, so clearing it drops them too, but they
+# are kept for longer
+SLOW_CACHE_TTL = 300
+
+# Expired entries are dropped on write, at most this often (seconds), so
+# one-off keys such as search results don't pile up for the whole session
+_PRUNE_INTERVAL = 60
+_next_prune = 0.0
+
+
+def strip_no_cache(args):
+    """Remove a --no-cache flag from args, clearing the cache if it was given.
+
+    Clearing drops every cached listing, so this command (and the next
+    ones) fetch fresh data.
+    """
+    if "--no-cache" not in args:
+        return args
+    api_cache.clear()
+    return [a for a in args if a != "--no-cache"]
+
+
+def _prune(now):
+    """Drop every api_cache entry older than the ttl it was stored with."""
+    global _next_prune
+    _next_prune = now + _PRUNE_INTERVAL
+    # Copy first: worker threads may be adding entries meanwhile
+    for full_key, (stamp, _, ttl) in list(api_cache.items()):
+        if now - stamp >= ttl:
+            api_cache.pop(full_key, None)
+
+
+def cache_peek(session_manager, key, ttl=API_CACHE_TTL):
+    """Return the fresh api_cache entry for key as a 1-tuple, or None.
+
+    A stale entry is removed from the cache.
+    """
+    config = session_manager.config
+    full_key = (config.profile, config.region) + key
+    cached = api_cache.get(full_key)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= ttl:
+        api_cache.pop(full_key, None)
+        return None
+    return (cached[1],)
+
+
+def cached_call(session_manager, key, fn, ttl=API_CACHE_TTL):
+    """Return fn(), cached under (profile, region) + key for ttl seconds."""
+    hit = cache_peek(session_manager, key, ttl)
+    if hit is not None:
+        return hit[0]
+    value = fn()
+    config = session_manager.config
+    now = time.monotonic()
+    if now >= _next_prune:
+        _prune(now)
+    api_cache[(config.profile, config.region) + key] = (now, value, ttl)
+    return value
@@ -6,6 +6,11 @@ from rich.console import Console
 from rich.table import Table
 from rich.syntax import Syntax
 
+try:
+    import orjson
+except ImportError:  # optional — stdlib json is used when it's missing
+    orjson = None
+
 console = Console()
 
 
@@ -16,8 +21,42 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _dumps(data):
+    """Pretty-print data as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, default=str,
+                option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME),
+            ).decode()
+        except TypeError:
+            # e.g. ints wider than 64 bits — let the stdlib handle it
+            pass
+    return json.dumps(data, indent=2, cls=DateTimeEncoder, default=str)
+
+
+def loads_json(text):
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def format_timestamp(value):
+    """Format a boto3 datetime to the second, e.g. '2024-05-01 12:30:00+00:00'."""
+    if isinstance(value, datetime):
+        return value.isoformat(" ", "seconds")
+    return str(value)
+
+
+def tag_value(tags, key, default=""):
+    """Return the value of tag ``key`` from an AWS Tags list, or default."""
+    return next((tag["Value"] for tag in tags if tag["Key"] == key), default)
+
+
 def print_json(data):
-    json_str = json.dumps(data, indent=2, cls=DateTimeEncoder, default=str)
+    json_str = _dumps(data)
     syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
     console.print(syntax)
 
@@ -1,9 +1,44 @@
 """Generic AWS pagination helper."""
+from concurrent.futures import ThreadPoolExecutor
+
+
+def get_paginator(client, method_name):
+    """Return client.get_paginator(method_name), reusing earlier paginators.
+
+    botocore builds a new paginator class on every get_paginator() call.
+    The cache lives on the client itself: a paginator holds its client's
+    bound method, so any external client-keyed cache would keep it alive.
+    """
+    paginators = client.__dict__.get("_aws_shell_paginators")
+    if paginators is None:
+        paginators = client.__dict__["_aws_shell_paginators"] = {}
+    paginator = paginators.get(method_name)
+    if paginator is None:
+        paginator = paginators[method_name] = client.get_paginator(method_name)
+    return paginator
+
+
+def prefetch_pages(pages):
+    """Iterate pages, fetching the next one while the caller handles the current.
+
+    Each request needs the previous page's continuation token, so only one
+    can be in flight; this overlaps it with the caller's formatting work.
+    """
+    it = iter(pages)
+    done = object()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(next, it, done)
+        while True:
+            page = future.result()
+            if page is done:
+                return
+            future = pool.submit(next, it, done)
+            yield page
 
 
 def paginate_all(client, method_name, result_key, **kwargs):
     try:
-        paginator = client.get_paginator(method_name)
+        paginator = get_paginator(client, method_name)
         results = []
         for page in paginator.paginate(**kwargs):
             results.extend(page.get(result_key, []))
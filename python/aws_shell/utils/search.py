@@ -1,38 +1,90 @@
 """Fuzzy search utilities for AWS resource configurations."""
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional — without it only exact substrings match
+    process = None
+
+# partial_ratio score (0-100) a near miss needs to count as a match
+_FUZZY_CUTOFF = 80
+
 
 def flatten_json(data, prefix=""):
     """Recursively flatten a nested dict/list into key-path -> value pairs."""
     items = []
+    if isinstance(data, (dict, list)):
+        _flatten_into(data, prefix, items)
+    else:
+        items.append((prefix, str(data)))
+    return items
+
+
+def _flatten_into(data, prefix, items):
+    # Append into one shared list; returning a list per level and extending
+    # the parent re-copies every leaf once for each level above it
     if isinstance(data, dict):
         for key, value in data.items():
             path = f"{prefix}.{key}" if prefix else key
             if isinstance(value, (dict, list)):
-                items.extend(flatten_json(value, path))
+                _flatten_into(value, path, items)
             else:
                 items.append((path, str(value)))
-    elif isinstance(data, list):
+    else:
         for i, value in enumerate(data):
             path = f"{prefix}[{i}]"
             if isinstance(value, (dict, list)):
-                items.extend(flatten_json(value, path))
+                _flatten_into(value, path, items)
             else:
                 items.append((path, str(value)))
-    else:
-        items.append((prefix, str(data)))
-    return items
 
 
-def fuzzy_search(data, keyword):
+def _truncate(value, max_len):
+    return value if len(value) <= max_len else value[:max_len - 3] + "..."
+
+
+def _approximate_matches(items, keyword_lower):
+    """Return items whose path or value nearly contains keyword, in order."""
+    # partial_ratio scores a short text by how well it fits inside keyword,
+    # so "0" would match any keyword containing a 0; only score texts about
+    # as long as keyword or longer (one character shorter allows a typo)
+    min_len = len(keyword_lower) - 1
+    hits = set()
+    for column in (0, 1):
+        choices = {i: item[column] for i, item in enumerate(items)
+                   if len(item[column]) >= min_len}
+        for _, _, index in process.extract(
+            keyword_lower, choices, scorer=fuzz.partial_ratio, processor=str.lower,
+            score_cutoff=_FUZZY_CUTOFF, limit=None,
+        ):
+            hits.add(index)
+    return [items[i] for i in sorted(hits)]
+
+
+def search_flat(items, keyword, max_value_len=None):
+    """Filter flattened (path, value) pairs by keyword (case-insensitive substring).
+
+    If nothing contains the keyword verbatim and RapidFuzz is installed,
+    near misses (e.g. typos) are returned instead. Values are matched in
+    full; with max_value_len, the returned ones are cut to that length
+    (ending in "...").
+    """
+    keyword_lower = keyword.lower()
+    matches = [
+        (path, value) for path, value in items
+        if keyword_lower in path.lower() or keyword_lower in value.lower()
+    ]
+    if not matches and process is not None and items:
+        matches = _approximate_matches(items, keyword_lower)
+    if max_value_len is not None:
+        matches = [(path, _truncate(value, max_value_len)) for path, value in matches]
+    return matches
+
+
+def fuzzy_search(data, keyword, max_value_len=None):
     """Search flattened JSON for keyword matches in paths or values.
 
     Returns list of (path, value) tuples where keyword appears
-    (case-insensitive substring match).
+    (case-insensitive substring match, or approximate with RapidFuzz),
+    values cut to max_value_len if given.
     """
-    keyword_lower = keyword.lower()
-    flat = flatten_json(data)
-    results = []
-    for path, value in flat:
-        if keyword_lower in path.lower() or keyword_lower in value.lower():
-            results.append((path, value))
-    return results
+    return search_flat(flatten_json(data), keyword, max_value_len)
@@ -293,7 +293,12 @@ class ResourceTable:
         return attr
 
     def __init__(self, data, columns=None, title=None):
-        self._data = data if isinstance(data, list) else list(data)
+        if isinstance(data, list):
+            self._data = data
+        else:
+            # Tuples are shared results from the API cache (utils.cache);
+            # copy the rows so edits through .data don't leak into them
+            self._data = [dict(row) if isinstance(row, dict) else row for row in data]
         self._columns = columns  # list of (key, header) or (key, header, style)
         self._title = title
 
@@ -0,0 +1,45 @@
+"""Tests for aws_shell.utils.search."""
+import pytest
+
+from aws_shell.utils.search import fuzzy_search
+
+INSTANCE = {
+    "Reservations": [{
+        "Instances": [{
+            "InstanceId": "i-0abc123456",
+            "SubnetId": "subnet-1",
+            "AmiLaunchIndex": 0,
+            "Tags": [{"Key": "Name", "Value": "prod-web-01"}],
+        }],
+    }],
+}
+
+
+def test_substring_match():
+    assert fuzzy_search(INSTANCE, "PROD-WEB") == [
+        ("Reservations[0].Instances[0].Tags[0].Value", "prod-web-01"),
+    ]
+
+
+def test_truncates_matched_values():
+    assert fuzzy_search(INSTANCE, "prod", max_value_len=7) == [
+        ("Reservations[0].Instances[0].Tags[0].Value", "prod..."),
+    ]
+
+
+def test_typo_finds_near_miss():
+    pytest.importorskip("rapidfuzz")
+    assert fuzzy_search(INSTANCE, "subnt") == [
+        ("Reservations[0].Instances[0].SubnetId", "subnet-1"),
+    ]
+
+
+def test_short_values_inside_keyword_do_not_match():
+    pytest.importorskip("rapidfuzz")
+    # "0" appears in both keywords but is no near miss for either
+    assert fuzzy_search(INSTANCE, "i-0abc12345x") == [
+        ("Reservations[0].Instances[0].InstanceId", "i-0abc123456"),
+    ]
+    assert fuzzy_search(INSTANCE, "prod-web-02") == [
+        ("Reservations[0].Instances[0].Tags[0].Value", "prod-web-01"),
+    ]